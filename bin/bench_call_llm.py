@@ -0,0 +1,44 @@
+"""Micro-benchmark: per-call chain setup overhead in gord.model, uncached vs cached.
+
+Builds the chains the agent uses on every step (router, planner, action with
+tools, validation, answer) without calling the API.
+"""
+import os
+import time
+
+from dotenv import load_dotenv
+
+# Load environment variables BEFORE importing any gord modules
+load_dotenv()
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from gord.model import _build_chain, _compiled_chain
+from gord.prompts import ACTION_SYSTEM_PROMPT, ANSWER_SYSTEM_PROMPT, PLANNING_SYSTEM_PROMPT, ROUTER_SYSTEM_PROMPT, VALIDATION_SYSTEM_PROMPT
+from gord.schemas import Answer, IsDone, RouteDecision, TaskList
+from gord.tools import TOOLS
+
+SHAPES = {
+    "router": dict(system_prompt=ROUTER_SYSTEM_PROMPT, output_schema=RouteDecision),
+    "planner": dict(system_prompt=PLANNING_SYSTEM_PROMPT, output_schema=TaskList),
+    "action (4 tools)": dict(system_prompt=ACTION_SYSTEM_PROMPT, tools=TOOLS),
+    "validation": dict(system_prompt=VALIDATION_SYSTEM_PROMPT, output_schema=IsDone),
+    "answer": dict(system_prompt=ANSWER_SYSTEM_PROMPT, output_schema=Answer),
+}
+
+N = 200
+
+
+def bench(fn, kwargs) -> float:
+    fn(**kwargs)  # warm up (and fill the cache for the cached variant)
+    t0 = time.perf_counter()
+    for _ in range(N):
+        fn(**kwargs)
+    return (time.perf_counter() - t0) / N * 1e6
+
+
+if __name__ == "__main__":
+    print(f"{'call shape':<18} {'uncached us/call':>17} {'cached us/call':>15} {'speedup':>8}")
+    for name, kwargs in SHAPES.items():
+        before = bench(_build_chain, kwargs)
+        after = bench(_compiled_chain, kwargs)
+        print(f"{name:<18} {before:>17.1f} {after:>15.2f} {before / after:>7.0f}x")
@@ -1,5 +1,6 @@
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import pprint
 
@@ -8,26 +9,36 @@ load_dotenv()
 API_KEY = os.environ["GOOGLE_PSE_API_KEY"]
 CX = os.environ["GOOGLE_PSE_CX"]
 
+def _fetch_page(endpoint: str, params: dict):
+    r = requests.get(endpoint, params=params, timeout=30)
+    r.raise_for_status()
+    return r.json()
+
+
 def google_search(query: str, count: int = 10, search_type: str = "web"):
     endpoint = "https://www.googleapis.com/customsearch/v1"
-    results = []
-    start = 1
-    while len(results) < count:
-        num = min(10, count - len(results))
+    # Page offsets are fixed (1, 11, 21, ...), so fetch every page at once
+    pages = []
+    for start in range(1, count + 1, 10):
         params = {
             "key": API_KEY,
             "cx": CX,
             "q": query,
-            "num": num,
+            "num": min(10, count - start + 1),
             "start": start,
         }
         # Add image search if requested
         if search_type == "image":
             params["searchType"] = "image"
+        pages.append(params)
 
-        r = requests.get(endpoint, params=params, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+    with ThreadPoolExecutor(max_workers=max(1, len(pages))) as pool:
+        futures = [pool.submit(_fetch_page, endpoint, params) for params in pages]
+
+    results = []
+    # Merge in rank order, stopping where sequential paging would have
+    for future in futures:
+        data = future.result()
         items = data.get("items", [])
         if not items:
             break
@@ -44,7 +55,6 @@ def google_search(query: str, count: int = 10, search_type: str = "web"):
         next_page = data.get("queries", {}).get("nextPage", [{}])[0].get("startIndex")
         if not next_page:
             break
-        start = next_page
     return results[:count]
 
 if __name__ == "__main__":
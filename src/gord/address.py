@@ -0,0 +1,101 @@
+import re
+from functools import lru_cache
+
+
+# USPS Publication 28 street suffixes (common forms)
+_SUFFIXES = {
+    "ALLEY": "ALY", "ALLY": "ALY", "ANNEX": "ANX", "ARCADE": "ARC", "AVENUE": "AVE", "AV": "AVE", "AVEN": "AVE",
+    "AVENU": "AVE", "AVN": "AVE", "AVNUE": "AVE", "BAYOU": "BYU", "BEACH": "BCH", "BEND": "BND", "BLUFF": "BLF",
+    "BOULEVARD": "BLVD", "BOUL": "BLVD", "BOULV": "BLVD", "BRANCH": "BR", "BRIDGE": "BRG", "BROOK": "BRK",
+    "BYPASS": "BYP", "CAMP": "CP", "CANYON": "CYN", "CAUSEWAY": "CSWY", "CENTER": "CTR", "CENTRE": "CTR",
+    "CIRCLE": "CIR", "CIRC": "CIR", "CLIFF": "CLF", "CLUB": "CLB", "COMMON": "CMN", "CORNER": "COR",
+    "COURSE": "CRSE", "COURT": "CT", "COVE": "CV", "CREEK": "CRK", "CRESCENT": "CRES", "CROSSING": "XING",
+    "DRIVE": "DR", "DRIV": "DR", "DRV": "DR", "ESTATE": "EST", "ESTATES": "ESTS", "EXPRESSWAY": "EXPY",
+    "EXTENSION": "EXT", "FALLS": "FLS", "FERRY": "FRY", "FIELD": "FLD", "FIELDS": "FLDS", "FLAT": "FLT",
+    "FOREST": "FRST", "FORK": "FRK", "FORT": "FT", "FREEWAY": "FWY", "GARDEN": "GDN", "GARDENS": "GDNS",
+    "GATEWAY": "GTWY", "GLEN": "GLN", "GREEN": "GRN", "GROVE": "GRV", "HARBOR": "HBR", "HAVEN": "HVN",
+    "HEIGHTS": "HTS", "HIGHWAY": "HWY", "HIWAY": "HWY", "HILL": "HL", "HILLS": "HLS", "HOLLOW": "HOLW",
+    "ISLAND": "IS", "JUNCTION": "JCT", "KEY": "KY", "KNOLL": "KNL", "LAKE": "LK", "LAKES": "LKS",
+    "LANDING": "LNDG", "LANE": "LN", "LIGHT": "LGT", "LOOP": "LOOP", "MANOR": "MNR", "MEADOW": "MDW",
+    "MEADOWS": "MDWS", "MILL": "ML", "MISSION": "MSN", "MOUNT": "MT", "MOUNTAIN": "MTN", "PARKWAY": "PKWY",
+    "PARKWY": "PKWY", "PKY": "PKWY", "PASSAGE": "PSGE", "PIKE": "PIKE", "PINE": "PNE", "PLACE": "PL",
+    "PLAIN": "PLN", "PLAINS": "PLNS", "PLAZA": "PLZ", "POINT": "PT", "POINTE": "PT", "PORT": "PRT",
+    "PRAIRIE": "PR", "RANCH": "RNCH", "RIDGE": "RDG", "RIVER": "RIV", "ROAD": "RD", "ROUTE": "RTE",
+    "SHORE": "SHR", "SHORES": "SHRS", "SPRING": "SPG", "SPRINGS": "SPGS", "SQUARE": "SQ", "STATION": "STA",
+    "STREET": "ST", "STR": "ST", "STRT": "ST", "SUMMIT": "SMT", "TERRACE": "TER", "TRACE": "TRCE",
+    "TRAIL": "TRL", "TRAILS": "TRL", "TURNPIKE": "TPKE", "VALLEY": "VLY", "VIEW": "VW", "VILLAGE": "VLG",
+    "VISTA": "VIS", "WALK": "WALK", "WAY": "WAY", "WELLS": "WLS",
+}
+
+_DIRECTIONS = {
+    "NORTH": "N", "SOUTH": "S", "EAST": "E", "WEST": "W",
+    "NORTHEAST": "NE", "NORTHWEST": "NW", "SOUTHEAST": "SE", "SOUTHWEST": "SW",
+}
+
+_STATES = {
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR", "CALIFORNIA": "CA", "COLORADO": "CO",
+    "CONNECTICUT": "CT", "DELAWARE": "DE", "DISTRICT OF COLUMBIA": "DC", "FLORIDA": "FL", "GEORGIA": "GA",
+    "HAWAII": "HI", "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA", "KANSAS": "KS",
+    "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME", "MARYLAND": "MD", "MASSACHUSETTS": "MA",
+    "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS", "MISSOURI": "MO", "MONTANA": "MT",
+    "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM",
+    "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH", "OKLAHOMA": "OK",
+    "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD",
+    "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT", "VERMONT": "VT", "VIRGINIA": "VA", "WASHINGTON": "WA",
+    "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY", "PUERTO RICO": "PR",
+}
+
+# Secondary unit designators; all collapse to one token since only the unit number matters for identity
+_UNITS = {"APARTMENT", "APT", "SUITE", "STE", "UNIT", "ROOM", "RM", "FLOOR", "FLR", "BUILDING", "BLDG", "#"}
+
+_COUNTRY_TAILS = ("UNITED STATES OF AMERICA", "UNITED STATES", "USA", "US")
+_ZIP = re.compile(r"^(\d{5})(?:-?\d{4})?$")
+_STATE_NAMES = sorted(_STATES, key=len, reverse=True)
+
+
+@lru_cache(maxsize=4096)
+def canonical_address(address: str) -> str:
+    """Stable key for a US address typed in any common form.
+
+    "1428 west ave miami FL 33139" and "1428 West Avenue, Miami, Florida
+    33139-1234" both become "1428 W AVE MIAMI FL 33139". This is a cache and
+    dedupe key, not a geocode: it does not validate or correct the address.
+    """
+    if not address:
+        return ""
+    text = address.upper().replace("#", " # ")
+    text = re.sub(r"[^\w\s#-]", " ", text)
+    text = " ".join(text.split())
+    for tail in _COUNTRY_TAILS:
+        if text.endswith(" " + tail):
+            text = text[: -len(tail) - 1]
+            break
+    # Multi-word state names ("NEW YORK") before the token pass; only as the
+    # last word(s) before an optional ZIP so "NEW YORK AVE" is left alone
+    for name in _STATE_NAMES:
+        m = re.search(rf"\b{name}(?=(?: \d{{5}}(?:-?\d{{4}})?)?$)", text)
+        if m:
+            text = text[: m.start()] + _STATES[name] + text[m.end():]
+            break
+
+    tokens = text.split()
+    out = []
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        zip_match = _ZIP.match(tok)
+        if zip_match:
+            out.append(zip_match.group(1))
+        elif tok in _UNITS and i + 1 < len(tokens) and i > 0:
+            # "STE 200", "APT 4B", "# 12" -> "UNIT 200"
+            out.append("UNIT")
+            while i + 1 < len(tokens) and tokens[i + 1] in _UNITS:
+                i += 1
+        elif tok in _DIRECTIONS:
+            out.append(_DIRECTIONS[tok])
+        elif tok in _SUFFIXES:
+            out.append(_SUFFIXES[tok])
+        else:
+            out.append(tok.strip("-") or tok)
+        i += 1
+    return " ".join(t for t in out if t)
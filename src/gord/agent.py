@@ -1,5 +1,6 @@
-
-from typing import List, Optional
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.messages import AIMessage
 
@@ -7,6 +8,8 @@ from gord.prompts import (
     ACTION_SYSTEM_PROMPT,
     ACTION_SYSTEM_PROMPT_PING_ONLY,
     ANSWER_SYSTEM_PROMPT,
+    FUSED_STEP_SYSTEM_PROMPT,
+    FUSED_STEP_SYSTEM_PROMPT_PING_ONLY,
     PLANNING_SYSTEM_PROMPT,
     VALIDATION_SYSTEM_PROMPT,
     ROUTER_SYSTEM_PROMPT,
@@ -20,64 +23,171 @@ from gord.prompts import (
     PING_ONLY_ANSWER_SYSTEM_PROMPT,
 )
 
-from gord.model import call_llm
+from gord.model import acall_llm, astream_llm
 from gord.utils.logger import Logger
-from gord.utils.ui import show_progress
+from gord.utils.ui import Colors, Spinner, show_progress
 from gord.schemas import Answer, IsDone, Task, TaskList, RouteDecision, Intent
-from gord.tools import TOOLS
-from gord.settings import SEARCH_ENGINE
+from gord.tools import TOOLS, prefetch_ping_aoa, discard_ping_prefetch
+from gord.observations import Observation, ObservationStore, ToolMemo, call_key, trim_results
+from gord.budget import Budget, set_current_budget
+from gord.cancel import CancelToken, set_current_token
+from gord.checkpoint import RunCheckpoint, load_checkpoint, new_run_id, save_checkpoint
+from gord.settings import SEARCH_ENGINE, TOOL_CONCURRENCY, TASK_CONCURRENCY, FUSED_STEPS, STREAM_ANSWER, CHECKPOINTS
 from gord import metrics
 
 
-
-class Agent:
-    def __init__(self, max_steps: int = 30, max_steps_per_task: int = 5):
+class _AbortRun(Exception):
+    """Raised inside a task loop to end the run without an answer."""
+
+
+class _RunState:
+    """Step accounting and tool observations shared by concurrently running tasks."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.step_count = 0
+        self.prior_steps = 0  # steps spent before a resume; the budget restarts
+        self.last_actions: List[str] = []
+        self.observations = ObservationStore()  # accumulate outputs for the whole session
+        self.memo = ToolMemo()
+        self.tasks: Optional[List[Task]] = None
+        self._replay: Dict[str, List[Observation]] = {}
+        self.ping_prefetch: Dict[str, asyncio.Task] = {}  # this run's in-flight Ping prefetches
+
+    @classmethod
+    def from_checkpoint(cls, cp: RunCheckpoint) -> "_RunState":
+        state = cls()
+        state.prior_steps = cp.step_count
+        state.tasks = cp.tasks
+        state.observations.restore(cp.observations)
+        # Successful calls from the earlier attempt are answered from the
+        # checkpoint if the model asks for them again
+        for o in cp.observations:
+            if not o.is_error:
+                state._replay.setdefault(call_key(o.tool_name, o.args), []).append(o)
+        return state
+
+    def has_replay(self, tool_name: str) -> bool:
+        """Whether the checkpoint holds an unclaimed successful result of this tool."""
+        with self._lock:
+            return any(obs and obs[0].tool_name == tool_name for obs in self._replay.values())
+
+    def take_replay(self, tool_name: str, args: Dict[str, Any]) -> Optional[Observation]:
+        """Claim a checkpointed result for this exact call, once per recorded call."""
+        with self._lock:
+            pending = self._replay.get(call_key(tool_name, args))
+            return pending.pop(0) if pending else None
+
+    def admit(self, action_sig: str, max_steps: int) -> Optional[bool]:
+        """Claim one global step for a tool call.
+
+        Returns None when the global budget is spent, False when the call
+        repeats the last four actions (stuck), and True otherwise.
+        """
+        with self._lock:
+            if self.step_count >= max_steps:
+                return None
+            self.last_actions.append(action_sig)
+            if len(self.last_actions) > 4:
+                self.last_actions = self.last_actions[-4:]
+            if len(set(self.last_actions)) == 1 and len(self.last_actions) == 4:
+                return False
+            self.step_count += 1
+            return True
+
+
+class AsyncAgent:
+    """Route/plan/act/validate/answer engine built on asyncio.
+
+    LLM calls and tools are awaited, so many sessions can share one event
+    loop; each `run` gets its own metrics scope.
+    """
+
+    def __init__(
+        self,
+        max_steps: int = 30,
+        max_steps_per_task: int = 5,
+        tool_concurrency: int = TOOL_CONCURRENCY,
+        task_concurrency: int = TASK_CONCURRENCY,
+        fused_steps: bool = FUSED_STEPS,
+        stream_answer: bool = STREAM_ANSWER,
+        checkpoints: bool = CHECKPOINTS,
+        budget: Optional[Budget] = None,
+    ):
         self.logger = Logger()
         self.max_steps = max_steps       
         self.max_steps_per_task = max_steps_per_task
+        self.tool_concurrency = max(1, tool_concurrency)
+        self.task_concurrency = max(1, task_concurrency)
+        self.fused_steps = fused_steps
+        self.stream_answer = stream_answer
+        self.checkpoints = checkpoints
+        self._budget_limits = budget or Budget()
+        self.budget = self._budget_limits
         self.route_decision: Optional[RouteDecision] = None
-        import threading
-        self._cancel_event = threading.Event()
+        self.run_id: Optional[str] = None
+        self._checkpoint: Optional[RunCheckpoint] = None
+        self.cancel_token = CancelToken()
 
     def request_cancel(self):
-        self._cancel_event.set()
+        """Stop the current run now, aborting any in-flight LLM or tool request. Thread-safe."""
+        self.cancel_token.cancel()
 
     def reset_cancel(self):
-        self._cancel_event.clear()
+        self.cancel_token = CancelToken()
 
     def _check_cancel(self):
-        if self._cancel_event.is_set():
-            raise KeyboardInterrupt()
+        if self.cancel_token.cancelled:
+            raise asyncio.CancelledError()
+
+    def _start_budget(self):
+        """Fresh budget clock for a run, visible to tool bodies through a context variable."""
+        self.budget = self._budget_limits.started()
+        set_current_budget(self.budget)
+
+    def _bind_cancel(self):
+        """Make request_cancel cancel the calling asyncio task; returns an unbind function.
+
+        Cancelling the task interrupts whatever it is awaiting (httpx requests
+        behind the model and tools included), so a run stops within one loop
+        iteration instead of at the next step boundary.
+        """
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        set_current_token(self.cancel_token)
+        return self.cancel_token.on_cancel(lambda: loop.call_soon_threadsafe(task.cancel))
 
     @show_progress("Routing...", "Routed")
-    def route(self, query: str) -> RouteDecision:
+    async def route(self, query: str) -> RouteDecision:
         self._check_cancel()
         prompt = f"Classify this query and extract address if applicable: {query}"
         try:
-            decision = call_llm(prompt, system_prompt=ROUTER_SYSTEM_PROMPT, output_schema=RouteDecision)
+            decision = await acall_llm(prompt, system_prompt=ROUTER_SYSTEM_PROMPT, output_schema=RouteDecision)
             return decision
         except Exception as e:
             self.logger._log(f"Routing failed: {e}")
             return RouteDecision(intent=Intent.GENERAL_QA, address=None, rationale="Fallback after error.")
 
     @show_progress("Planning tasks...", "Tasks planned")
-    def plan_tasks(self, query: str) -> List[Task]:
+    async def plan_tasks(self, query: str) -> List[Task]:
         self._check_cancel()
         selected_tools = self._select_tools_for_intent()
         tool_descriptions = "\n".join([f"- {t.name}: {t.description}" for t in selected_tools])
         # Incorporate routing decision context
         intent = self.route_decision.intent if self.route_decision else Intent.GENERAL_QA
         addr = self.route_decision.address if self.route_decision else None
+        # Stable content first and per-query fields last, so the provider's prefix cache can reuse it
         prompt = f"""
-        User query: "{query}"
-        Intent: {intent}
-        Address: {addr or 'N/A'}
-        
         Tools available:
         {tool_descriptions}
 
         Create a list of tasks to be completed.
-        Example: {{"tasks": [{{"id": 1, "description": "some task", "done": false}}]}}
+        Set "depends_on" to the ids of earlier tasks whose results a task needs; leave it empty when a task can run independently.
+        Example: {{"tasks": [{{"id": 1, "description": "some task", "done": false, "depends_on": []}}, {{"id": 2, "description": "task using the results of task 1", "done": false, "depends_on": [1]}}]}}
+
+        Intent: {intent}
+        Address: {addr or 'N/A'}
+        User query: "{query}"
         """
         # Choose planning system prompt by intent
         if intent == Intent.UNDERWRITING_REPORT:
@@ -93,7 +203,7 @@ class Agent:
         else:
             system_prompt = PLANNING_SYSTEM_PROMPT
         try:
-            response = call_llm(prompt, system_prompt=system_prompt, output_schema=TaskList)
+            response = await acall_llm(prompt, system_prompt=system_prompt, output_schema=TaskList)
             tasks = response.tasks
         except Exception as e:
             self.logger._log(f"Planning failed: {e}")
@@ -104,164 +214,521 @@ class Agent:
         return tasks
 
     @show_progress("Thinking...", "")
-    def ask_for_actions(self, task_desc: str, last_outputs: str = "") -> AIMessage:
+    async def ask_for_actions(self, task_desc: str, last_outputs: str = "") -> AIMessage:
         """ ask LLM what to do  """
         self._check_cancel()
         # last_outputs = textual feedback of what we just tried
         intent = self.route_decision.intent if self.route_decision else Intent.GENERAL_QA
         address = self.route_decision.address if self.route_decision else None
         prompt = f"""
-        We are working on: "{task_desc}".
-        Intent: {intent}
-        Address: {address or 'N/A'}
         Here is a history of tool outputs from the session so far: {last_outputs}
 
+        Intent: {intent}
+        Address: {address or 'N/A'}
+        We are working on: "{task_desc}".
         Based on the task and the outputs, what should be the next step?
         """
         try:
             if intent == Intent.PING_PROPERTY_SUMMARY:
-                return call_llm(prompt, system_prompt=ACTION_SYSTEM_PROMPT_PING_ONLY, tools=self._select_tools_for_intent())
-            return call_llm(prompt, system_prompt=ACTION_SYSTEM_PROMPT, tools=self._select_tools_for_intent())
+                return await acall_llm(prompt, system_prompt=ACTION_SYSTEM_PROMPT_PING_ONLY, tools=self._select_tools_for_intent())
+            return await acall_llm(prompt, system_prompt=ACTION_SYSTEM_PROMPT, tools=self._select_tools_for_intent())
         except Exception as e:
             self.logger._log(f"ask_for_actions failed: {e}")
             return AIMessage(content="Failed to get actions.")
 
+    @show_progress("Thinking...", "")
+    async def ask_for_next_step(self, task_desc: str, last_outputs: str = "") -> AIMessage:
+        """ ask LLM whether the task is done and, if not, what to do next, in one call """
+        self._check_cancel()
+        intent = self.route_decision.intent if self.route_decision else Intent.GENERAL_QA
+        address = self.route_decision.address if self.route_decision else None
+        prompt = f"""
+        Here is a history of tool outputs from the session so far: {last_outputs}
+
+        Intent: {intent}
+        Address: {address or 'N/A'}
+        We are working on: "{task_desc}".
+        Is the task done? If not, what should be the next step?
+        """
+        # IsDone is offered as one more tool so a single response carries
+        # either the completion verdict or the next tool calls.
+        tools = self._select_tools_for_intent() + [IsDone]
+        system_prompt = FUSED_STEP_SYSTEM_PROMPT_PING_ONLY if intent == Intent.PING_PROPERTY_SUMMARY else FUSED_STEP_SYSTEM_PROMPT
+        try:
+            return await acall_llm(prompt, system_prompt=system_prompt, tools=tools, tool_choice="required")
+        except Exception as e:
+            self.logger._log(f"ask_for_next_step failed: {e}")
+            return AIMessage(content="Failed to get next step.")
+
     @show_progress("Validating...", "")
-    def ask_if_done(self, task_desc: str, recent_results: str) -> bool:
+    async def ask_if_done(self, task_desc: str, recent_results: str) -> bool:
         """ ask LLM if task is done """
         self._check_cancel()
         prompt = f"""
-        We were trying to complete the task: "{task_desc}".
         Here is a history of tool outputs from the session so far: {recent_results}
 
+        We were trying to complete the task: "{task_desc}".
         Is the task done?
         """
         try:
-            resp = call_llm(prompt, system_prompt=VALIDATION_SYSTEM_PROMPT, output_schema=IsDone)
+            resp = await acall_llm(prompt, system_prompt=VALIDATION_SYSTEM_PROMPT, output_schema=IsDone)
             return resp.done
-        except:
+        except Exception:
             return False
 
-    def _execute_tool(self, tool, tool_name: str, inp_args):
+    async def _execute_tool(self, tool, tool_name: str, inp_args):
         """Execute a tool with progress indication."""
         # Create a dynamic decorator with the tool name
         @show_progress(f"Executing {tool_name}...", "")
-        def run_tool():
+        async def run_tool():
             self._check_cancel()
-            return tool.run(inp_args)
-        return run_tool()
+            return await tool.arun(inp_args)
+        return await run_tool()
+
+    async def _execute_tools(self, batch: List[Tuple[Any, str, dict]]) -> List[Tuple[Any, Optional[BaseException]]]:
+        """Run a batch of tool calls concurrently, at most tool_concurrency at a time.
+
+        Returns one (result, error) pair per call, in the same order as `batch`.
+        A single call, or tool_concurrency=1, runs one after another as before.
+        """
+        if len(batch) <= 1 or self.tool_concurrency <= 1:
+            outcomes = []
+            for tool, tool_name, inp_args in batch:
+                try:
+                    outcomes.append((await self._execute_tool(tool, tool_name, inp_args), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+            return outcomes
+
+        self._check_cancel()
+        names = ", ".join(name for _, name, _ in batch)
+        slots = asyncio.Semaphore(self.tool_concurrency)
+
+        async def run_one(tool, inp_args):
+            async with slots:
+                return await tool.arun(inp_args)
+
+        with self.logger.progress(f"Executing {names}...", ""):
+            results = await asyncio.gather(*(run_one(tool, inp_args) for tool, _, inp_args in batch), return_exceptions=True)
+        self._check_cancel()
+
+        outcomes = []
+        for r in results:
+            if isinstance(r, (asyncio.CancelledError, KeyboardInterrupt)):
+                raise r
+            outcomes.append((None, r) if isinstance(r, BaseException) else (r, None))
+        return outcomes
     
     def confirm_action(self, tool: str, input_str: str) -> bool:
         # In production you'd ask the user; here we just log and auto-confirm
         # Risky tools are not implemented in this version.
         return True
 
-    def run(self, query: str):
-        """Main agent loop."""
+    async def run(self, query: str, route_decision: Optional[RouteDecision] = None):
+        """Main agent loop.
+
+        Pass `route_decision` when the intent and address are already known
+        (e.g. batch runs) to skip the routing call.
+        """
         metrics.reset() # Reset state
         self.reset_cancel()
-        step_count = 0
-        last_actions = []
-        session_outputs = []  # accumulate outputs for the whole session
+        self._start_budget()
+        unbind = self._bind_cancel()
+        state = _RunState()
+        self.run_id = new_run_id()
+        self._checkpoint = RunCheckpoint(run_id=self.run_id, query=query)
 
-        # Route first
-        self.route_decision = self.route(query)
+        try:
+            # Route first
+            self.route_decision = route_decision or await self.route(query)
+            return await self._run_routed(query, state)
+        finally:
+            unbind()
+
+    async def resume(self, run_id: str):
+        """Continue a saved run from its last checkpoint.
+
+        Finished tasks are not run again and tool calls that already
+        succeeded are answered from the checkpoint. The step budget restarts.
+        """
+        cp = load_checkpoint(run_id)
+        metrics.restore(cp.metrics)
+        self.reset_cancel()
+        self.run_id = cp.run_id
+        self._checkpoint = cp
+        if cp.status == "completed" and cp.answer:
+            self.logger.log_summary(cp.answer)
+            return cp.answer
+        state = _RunState.from_checkpoint(cp)
+        self._start_budget()
+        unbind = self._bind_cancel()
+        try:
+            self.route_decision = cp.route_decision or await self.route(cp.query)
+            return await self._run_routed(cp.query, state)
+        finally:
+            unbind()
+
+    async def _run_routed(self, query: str, state: "_RunState"):
+        """Run a routed query to an answer, checkpointing along the way."""
         self.logger._log(f"Routed intent: {self.route_decision.intent} | address: {self.route_decision.address or 'N/A'}")
+        self._save(state)
+
+        # Every address intent starts with Ping AOA; start it while planning
+        # runs, unless a resumed run already has the result
+        prefetch = None
+        if self.route_decision.address and not state.has_replay("ping_aoa_search"):
+            prefetch = prefetch_ping_aoa(self.route_decision.address, state.ping_prefetch)
+        try:
+            if self.route_decision.intent == Intent.PING_PROPERTY_SUMMARY and self.route_decision.address:
+                answer = await self._run_ping_summary(query, state)
+            else:
+                answer = await self._run_planned(query, state)
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            self._save(state, status="cancelled")
+            raise
+        except Exception:
+            self._save(state, status="failed")
+            raise
+        finally:
+            if prefetch is not None:
+                discard_ping_prefetch(state.ping_prefetch, prefetch)
+        self._save(state, status="completed" if answer is not None else "aborted", answer=answer)
+        return answer
+
+    def _save(self, state: "_RunState", status: Optional[str] = None, answer: Optional[str] = None):
+        """Write the run's current state to its checkpoint file."""
+        cp = self._checkpoint
+        if not self.checkpoints or cp is None:
+            return
+        cp.route_decision = self.route_decision
+        cp.tasks = state.tasks
+        cp.observations = state.observations.items()
+        cp.step_count = state.prior_steps + state.step_count
+        cp.metrics = metrics.snapshot()
+        cp.status = status or "running"
+        cp.answer = answer
+        try:
+            save_checkpoint(cp)
+        except OSError as e:
+            # A full disk or read-only directory should not end the run
+            self.logger._log(f"Checkpoint failed: {e}")
+            return
+        if cp.status in ("cancelled", "aborted", "failed"):
+            self.logger.log_run_saved(cp.run_id, cp.status)
+
+    async def _run_ping_summary(self, query: str, state: "_RunState"):
+        """Fast path for PING_PROPERTY_SUMMARY: one Ping call, then the answer.
+
+        The tool set for this intent is fixed to ping_aoa_search, so the
+        planner and action/validate loop are skipped entirely.
+        """
+        self._check_cancel()
+        ping_tool = next(t for t in TOOLS if t.name == 'ping_aoa_search')
+        inp_args = {"address": self.route_decision.address}
+        if state.take_replay(ping_tool.name, inp_args):
+            self.logger._log(f"Reusing checkpointed {ping_tool.name} result")
+        else:
+            await self._ping_summary_call(ping_tool, inp_args, state)
+            self._save(state)
 
-        # Plan tasks
-        tasks = self.plan_tasks(query)
+        self._check_cancel()
+        answer = await self._answer(query, state)
+        self.logger.log_metrics(metrics.snapshot())
+        self.logger.log_budget(self.budget.summary())
+        return answer
 
+    async def _ping_summary_call(self, ping_tool, inp_args: dict, state: "_RunState"):
+        try:
+            result = await self._execute_tool(ping_tool, ping_tool.name, inp_args)
+            self.logger.log_tool_run(ping_tool.name, f"{result}")
+            state.observations.add(None, ping_tool.name, inp_args, result)
+        except Exception as e:
+            self.logger._log(f"Tool execution failed: {e}")
+            state.observations.add(None, ping_tool.name, inp_args, e, is_error=True)
+
+    async def _run_planned(self, query: str, state: "_RunState"):
+        """Plan, execute tasks and answer for an already routed query."""
+        # Plan tasks, unless a resumed run already has them
+        if state.tasks is None:
+            state.tasks = await self.plan_tasks(query)
+            self._save(state)
+        else:
+            self.logger.log_task_list([t.dict() for t in state.tasks])
+        tasks = state.tasks
 
         # If no tasks were created, query is out of scope - answer directly
         if not tasks:
-            answer = self._generate_answer(query, session_outputs)
-            self.logger.log_summary(answer)
+            answer = await self._answer(query, state)
             return answer
 
         # Main agent loop
-        while any(not t.done for t in tasks):
-            if step_count >= self.max_steps:
-                self.logger._log("Global max steps reached — aborting to avoid runaway loop.")
-                break
-
-            task = next(t for t in tasks if not t.done)
-            self.logger.log_task_start(task.description)
-
-            per_task_steps = 0
-            while per_task_steps < self.max_steps_per_task:
-                if step_count >= self.max_steps:
-                    self.logger._log("Global max steps reached — stopping.")
-                    return
+        try:
+            await self._schedule_tasks(tasks, state)
+        except _AbortRun:
+            return
 
-                ai_message = self.ask_for_actions(task.description, last_outputs="\n".join(session_outputs))
-                
-                if not ai_message.tool_calls:
-                    # No tool calls means either the task is done or cannot be done with tools
-                    # Always mark as done to avoid infinite loops
-                    # The final answer generation will provide an appropriate response
-                    task.done = True
-                    self.logger.log_task_done(task.description)
-                    break
+        # Generate answer based on all collected data
+        self._check_cancel()
+        answer = await self._answer(query, state)
+        # Print API usage metrics at end
+        self.logger.log_metrics(metrics.snapshot())
+        self.logger.log_budget(self.budget.summary())
+        return answer
 
-                for tool_call in ai_message.tool_calls:
-                    self._check_cancel()
-                    if step_count >= self.max_steps:
-                        break
+    def _ready_tasks(self, tasks: List[Task], running: set) -> List[Task]:
+        """Tasks that are not done, not running, and whose dependencies are all done."""
+        done_ids = {t.id for t in tasks if t.done}
+        known_ids = {t.id for t in tasks}
+        ready = []
+        for t in tasks:
+            if t.done or t.id in running:
+                continue
+            # Unknown or self-referencing ids from the planner are ignored
+            deps = {d for d in t.depends_on if d in known_ids and d != t.id}
+            if deps <= done_ids:
+                ready.append(t)
+        return ready
+
+    async def _schedule_tasks(self, tasks: List[Task], state: "_RunState"):
+        """Run each task's action/validate loop once its dependencies are done.
+
+        Independent tasks run as concurrent asyncio tasks, up to task_concurrency. A task
+        that exhausts its per-task budget without finishing is scheduled again,
+        as long as the global step budget allows.
+        """
+        if self.task_concurrency <= 1:
+            while any(not t.done for t in tasks):
+                if state.step_count >= self.max_steps:
+                    self.logger._log("Global max steps reached — aborting to avoid runaway loop.")
+                    break
+                if self.budget.exhausted():
+                    self.logger._log("Run budget exhausted — answering with the data collected so far.")
+                    break
+                ready = self._ready_tasks(tasks, set())
+                # A dependency cycle leaves nothing ready; fall back to plan order
+                task = ready[0] if ready else next(t for t in tasks if not t.done)
+                try:
+                    await asyncio.wait_for(self._run_task(task, state), self.budget.remaining_seconds())
+                except asyncio.TimeoutError:
+                    self.logger._log("Run time budget reached — answering with the data collected so far.")
+                    break
+                finally:
+                    self._save(state)
+            return
 
-                    tool_name = tool_call["name"]
-                    inp_args = tool_call["args"]
-                    action_sig = f"{tool_name}:{inp_args}"
+        running: Dict[asyncio.Task, Task] = {}
+        try:
+            while any(not t.done for t in tasks):
+                self._check_cancel()
+                if state.step_count >= self.max_steps and not running:
+                    self.logger._log("Global max steps reached — aborting to avoid runaway loop.")
+                    break
+                # Running task loops notice the exhausted budget themselves; start no new ones
+                out_of_budget = self.budget.exhausted()
+                if out_of_budget and not running:
+                    self.logger._log("Run budget exhausted — answering with the data collected so far.")
+                    break
 
+                if state.step_count < self.max_steps and not out_of_budget:
+                    ready = self._ready_tasks(tasks, {t.id for t in running.values()})
+                    if not ready and not running:
+                        ready = [next(t for t in tasks if not t.done)]
+                    for task in ready[: self.task_concurrency - len(running)]:
+                        running[asyncio.create_task(self._run_task(task, state))] = task
+
+                finished, _ = await asyncio.wait(running, timeout=self.budget.remaining_seconds(), return_when=asyncio.FIRST_COMPLETED)
+                if not finished:
+                    # Wall-clock budget ran out mid-task; the finally block stops the stragglers
+                    self.logger._log("Run time budget reached — answering with the data collected so far.")
+                    break
+                for f in finished:
+                    running.pop(f)
+                    # Re-raise _AbortRun / cancellation from the task loop
+                    f.result()
+                self._save(state)
+        finally:
+            # Stop sibling task loops when one aborts or the run is cancelled
+            for f in running:
+                f.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _run_task(self, task: Task, state: "_RunState"):
+        """Action/validate loop for a single task, bounded by max_steps_per_task."""
+        self.logger.log_task_start(task.description)
+
+        per_task_steps = 0
+        while per_task_steps < self.max_steps_per_task:
+            if state.step_count >= self.max_steps:
+                self.logger._log("Global max steps reached — stopping.")
+                raise _AbortRun()
+            if self.budget.exhausted():
+                # Leave the task open; the scheduler goes straight to the answer
+                return
+
+            if self.fused_steps:
+                ai_message = await self.ask_for_next_step(task.description, last_outputs=state.observations.render(task.id, task.depends_on))
+            else:
+                ai_message = await self.ask_for_actions(task.description, last_outputs=state.observations.render(task.id, task.depends_on))
+            done_calls = [c for c in ai_message.tool_calls if c["name"] == IsDone.__name__]
+            tool_calls = [c for c in ai_message.tool_calls if c["name"] != IsDone.__name__]
+            
+            if not tool_calls:
+                # No tool calls means either the task is done or cannot be done with tools
+                # Always mark as done to avoid infinite loops
+                # The final answer generation will provide an appropriate response
+                task.done = True
+                self.logger.log_task_done(task.description)
+                return
+
+            # Admit the whole batch first so stuck detection and step
+            # accounting see the calls in the order the model issued them.
+            batch = []
+            claims = []
+            reused = []
+            for tool_call in tool_calls:
+                self._check_cancel()
+                tool_name = tool_call["name"]
+                inp_args = tool_call["args"]
+                if state.take_replay(tool_name, inp_args):
+                    # Already in the observations restored from the checkpoint
+                    self.logger._log(f"Reusing checkpointed {tool_name} result")
+                    per_task_steps += 1
+                    continue
+                admitted = state.admit(f"{tool_name}:{inp_args}", self.max_steps)
+                if admitted is None:
+                    break
+                if not admitted:
                     # stuck detection
-                    last_actions.append(action_sig)
-                    if len(last_actions) > 4:
-                        last_actions = last_actions[-4:]
-                    if len(set(last_actions)) == 1 and len(last_actions) == 4:
-                        self.logger._log("Detected repeating action — aborting to avoid loop.")
-                        return
-                    
-                    tool_to_run = next((t for t in TOOLS if t.name == tool_name), None)
-                    if tool_to_run and self.confirm_action(tool_name, str(inp_args)):
-                        try:
-                            result = self._execute_tool(tool_to_run, tool_name, inp_args)
-                            self.logger.log_tool_run(tool_name, f"{result}")
-                            session_outputs.append(f"Output of {tool_name} with args {inp_args}: {result}")
-                        except Exception as e:
-                            self.logger._log(f"Tool execution failed: {e}")
-                            session_outputs.append(f"Error from {tool_name} with args {inp_args}: {e}")
-                    else:
-                        self.logger._log(f"Invalid tool: {tool_name}")
-
-                    step_count += 1
+                    self.logger._log("Detected repeating action — aborting to avoid loop.")
+                    raise _AbortRun()
+
+                tool_to_run = next((t for t in TOOLS if t.name == tool_name), None)
+                # Same call (or a larger one) earlier in this run: use its result
+                earlier = state.memo.lookup(tool_to_run, inp_args) if tool_to_run else None
+                if earlier:
+                    reused.append((tool_name, inp_args) + earlier)
                     per_task_steps += 1
-
-                # check after this batch if task seems done
-                if self.ask_if_done(task.description, "\n".join(session_outputs)):
+                    continue
+                if not self.budget.allows_tool(tool_name):
+                    # Another call in this batch used up the provider's allowance
+                    self.logger._log(f"Skipping {tool_name}: provider call budget reached")
+                    state.observations.add(task.id, tool_name, inp_args, "call budget for this provider is used up", is_error=True)
+                    per_task_steps += 1
+                    continue
+
+                if tool_to_run and self.confirm_action(tool_name, str(inp_args)):
+                    batch.append((tool_to_run, tool_name, inp_args))
+                    claims.append(state.memo.claim(tool_to_run, inp_args))
+                else:
+                    self.logger._log(f"Invalid tool: {tool_name}")
+
+                per_task_steps += 1
+
+            # Results are recorded in call order regardless of completion order
+            try:
+                outcomes = await self._execute_tools(batch)
+                for (tool, _, inp_args), fut, (result, error) in zip(batch, claims, outcomes):
+                    state.memo.resolve(tool, inp_args, fut, result, error)
+            finally:
+                # A cancelled batch must not leave later identical calls waiting
+                for (tool, _, inp_args), fut in zip(batch, claims):
+                    state.memo.resolve(tool, inp_args, fut, error=RuntimeError("Earlier identical call was cancelled"))
+            for (_, tool_name, inp_args), (result, error) in zip(batch, outcomes):
+                if error is None:
+                    self.logger.log_tool_run(tool_name, f"{result}")
+                    state.observations.add(task.id, tool_name, inp_args, result)
+                else:
+                    self.logger._log(f"Tool execution failed: {error}")
+                    state.observations.add(task.id, tool_name, inp_args, error, is_error=True)
+            for tool_name, inp_args, fut, keep in reused:
+                try:
+                    # shield: this task being cancelled must not cancel the shared call
+                    result = trim_results(await asyncio.shield(fut), keep)
+                except Exception as e:
+                    self.logger._log(f"Tool execution failed: {e}")
+                    state.observations.add(task.id, tool_name, inp_args, e, is_error=True)
+                    continue
+                metrics.increment('tool_calls_avoided', 1)
+                self.logger.log_tool_run(tool_name, f"(reused) {result}")
+                state.observations.add(task.id, tool_name, inp_args, result, reused=True)
+            self._save(state)
+
+            if self.budget.tight():
+                # Short on budget: take this batch as the task's result instead of paying for validation
+                task.done = True
+                self.logger.log_task_done(task.description)
+                return
+
+            if self.fused_steps:
+                # Validation is folded into the next step's call, unless the
+                # model already declared these calls the task's last ones
+                if any(c["args"].get("done") for c in done_calls):
                     task.done = True
                     self.logger.log_task_done(task.description)
-                    break
+                    return
+                continue
 
-        # Generate answer based on all collected data
-        self._check_cancel()
-        answer = self._generate_answer(query, session_outputs)
+            # check after this batch if task seems done
+            if await self.ask_if_done(task.description, state.observations.render(task.id, task.depends_on)):
+                task.done = True
+                self.logger.log_task_done(task.description)
+                return
+    
+    async def _answer(self, query: str, state: "_RunState") -> str:
+        """Generate the final answer and show it, streamed or as one box."""
+        if self.stream_answer:
+            return await self._stream_answer(query, state.observations.texts())
+        answer = await self._generate_answer(query, state.observations.texts())
         self.logger.log_summary(answer)
-        # Print API usage metrics at end
-        self.logger.log_metrics(metrics.snapshot())
         return answer
-    
+
+    async def _stream_answer(self, query: str, session_outputs: list) -> str:
+        """Stream the final answer to the terminal as tokens arrive.
+
+        The answer stage drops the single-field Answer wrapper and streams
+        plain text; the result is still validated into Answer before returning.
+        """
+        answer_prompt, system_prompt = self._answer_request(query, session_outputs)
+        spinner = Spinner("Generating answer...", color=Colors.CYAN)
+        spinner.start()
+        started = False
+
+        def on_token(token: str):
+            nonlocal started
+            if not started:
+                spinner.stop()
+                self.logger.log_answer_start()
+                started = True
+            self.logger.log_answer_token(token)
+
+        try:
+            text = await astream_llm(answer_prompt, system_prompt=system_prompt, on_token=on_token)
+        finally:
+            spinner.stop()
+            if started:
+                self.logger.log_answer_end()
+        return Answer(answer=text).answer
+
     @show_progress("Generating answer...", "Answer ready")
-    def _generate_answer(self, query: str, session_outputs: list) -> str:
+    async def _generate_answer(self, query: str, session_outputs: list) -> str:
         """Generate the final answer based on collected data."""
+        answer_prompt, system_prompt = self._answer_request(query, session_outputs)
+        answer_obj = await acall_llm(answer_prompt, system_prompt=system_prompt, output_schema=Answer)
+        return answer_obj.answer
+
+    def _answer_request(self, query: str, session_outputs: list) -> Tuple[str, str]:
+        """Prompt and intent-specific system prompt for the answer stage."""
         all_results = "\n\n".join(session_outputs) if session_outputs else "No data was collected."
         intent = self.route_decision.intent if self.route_decision else Intent.GENERAL_QA
         address = self.route_decision.address if self.route_decision else None
         answer_prompt = f"""
-        Original user query: "{query}"
-        Intent: {intent}
-        Address: {address or 'N/A'}
-
         Data and results collected from tools:
         {all_results}
+
+        Intent: {intent}
+        Address: {address or 'N/A'}
+        Original user query: "{query}"
         """
         # Choose answer system prompt by intent
         if intent == Intent.UNDERWRITING_REPORT:
@@ -275,12 +742,13 @@ class Agent:
             system_prompt = PING_ONLY_ANSWER_SYSTEM_PROMPT
         else:
             system_prompt = ANSWER_SYSTEM_PROMPT
-
-        answer_obj = call_llm(answer_prompt, system_prompt=system_prompt, output_schema=Answer)
-        return answer_obj.answer
+        return answer_prompt, system_prompt
 
     def _select_tools_for_intent(self):
-        "tool selection by intent/settings"
+        "tool selection by intent/settings, minus tools whose provider budget is used up"
+        return [t for t in self._intent_tools() if self.budget.allows_tool(t.name)]
+
+    def _intent_tools(self):
         intent = self.route_decision.intent if self.route_decision else Intent.GENERAL_QA
         # Always start with Ping AOA
         selected = []
@@ -313,3 +781,57 @@ class Agent:
                 selected.append(brave)
 
         return selected
+
+
+class Agent:
+    """Blocking front end over AsyncAgent, used by the interactive CLI.
+
+    Accepts the same arguments as AsyncAgent; attributes such as
+    route_decision and logger are read from the wrapped engine.
+
+    Every query runs on one long-lived event loop. Async HTTP clients held
+    by module-level objects (the OpenAI client, gord.http) keep connections
+    bound to the loop that opened them; a fresh loop per query would make the
+    next query's first requests fail on a closed loop and be silently resent.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._engine = AsyncAgent(*args, **kwargs)
+        self._loop = asyncio.new_event_loop()
+
+    def __getattr__(self, name):
+        return getattr(self._engine, name)
+
+    def request_cancel(self):
+        self._engine.request_cancel()
+
+    def reset_cancel(self):
+        self._engine.reset_cancel()
+
+    def _run(self, coro):
+        task = self._loop.create_task(coro)
+        try:
+            return self._loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            # Callers of the sync API have always seen cancellation as KeyboardInterrupt
+            raise KeyboardInterrupt()
+        except KeyboardInterrupt:
+            # Ctrl-C stopped the loop mid-run; finish the task so it does not
+            # resume inside the next query
+            task.cancel()
+            try:
+                self._loop.run_until_complete(task)
+            except BaseException:
+                pass
+            raise
+
+    def resume(self, run_id: str):
+        """Resume a saved run."""
+        return self._run(self._engine.resume(run_id))
+
+    def run(self, query: str, route_decision: Optional[RouteDecision] = None):
+        """Run one query to completion."""
+        return self._run(self._engine.run(query, route_decision))
+
+    def close(self):
+        self._loop.close()
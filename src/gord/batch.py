@@ -0,0 +1,257 @@
+import asyncio
+import csv
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from gord.address import canonical_address
+from gord.agent import AsyncAgent
+from gord.schemas import Intent, RouteDecision
+from gord.settings import BATCH_CONCURRENCY, BATCH_RETRIES
+from gord.utils.ui import UI, set_quiet
+from gord import metrics
+
+
+# Same phrasing the interactive examples use, so routing-free batch runs get
+# the query text a user would have typed.
+INTENT_QUERIES = {
+    Intent.UNDERWRITING_REPORT: "Generate an underwriting report for {address}",
+    Intent.BUSINESS_PROFILE: "Tell me everything about the business at {address}",
+    Intent.PING_PROPERTY_SUMMARY: "What does Ping know about {address}",
+    Intent.DEEP_UNDERWRITING_REPORT: "Deep Underwriting Report for {address}",
+    Intent.DEEP_COMPANY_PROFILE: "Deep Company Profile for {address}",
+}
+
+OUTPUT_FIELDS = ["row", "address", "intent", "status", "attempts", "seconds", "answer", "error", "metrics", "budget"]
+
+_ADDRESS_KEYS = ("address", "full_address", "location_address", "street_address", "addr")
+_STREET_KEYS = ("street", "address_line_1", "address1", "addressline1", "street_address")
+_CITY_KEYS = ("city", "town")
+_STATE_KEYS = ("state", "state_code", "province")
+_ZIP_KEYS = ("zip", "zip_code", "zipcode", "postal_code", "postalcode", "postcode")
+
+
+def _pick(record: Dict[str, Any], keys: Iterable[str]) -> Optional[str]:
+    lowered = {str(k).strip().lower().replace(" ", "_"): v for k, v in record.items()}
+    for k in keys:
+        v = lowered.get(k)
+        if isinstance(v, (str, int)) and str(v).strip():
+            return str(v).strip()
+    return None
+
+
+def _address_from_record(record: Dict[str, Any]) -> Optional[str]:
+    """Single-line "street, city, state zip" from a flat record, if it looks like a location."""
+    street = _pick(record, _STREET_KEYS)
+    city = _pick(record, _CITY_KEYS)
+    if street and city:
+        state = _pick(record, _STATE_KEYS)
+        zip_code = _pick(record, _ZIP_KEYS)
+        tail = " ".join(p for p in (state, zip_code) if p)
+        return ", ".join(p for p in (street, city, tail) if p)
+    full = _pick(record, _ADDRESS_KEYS)
+    if full and any(ch.isdigit() for ch in full):
+        return full
+    return None
+
+
+def _dedupe(addresses: Iterable[str]) -> List[str]:
+    seen = set()
+    out = []
+    for a in addresses:
+        key = canonical_address(a)
+        if a and key not in seen:
+            seen.add(key)
+            out.append(a)
+    return out
+
+
+def addresses_from_sov_json(data: Any) -> List[str]:
+    """Collect location addresses from an SOV Fixer JSON output.
+
+    Walks the document and treats any object with street+city (or a full
+    address string) as one location; nested objects of a location are not
+    searched again.
+    """
+    found: List[str] = []
+
+    def walk(node: Any):
+        if isinstance(node, dict):
+            addr = _address_from_record(node)
+            if addr:
+                found.append(addr)
+                return
+            for v in node.values():
+                walk(v)
+        elif isinstance(node, list):
+            for v in node:
+                walk(v)
+
+    walk(data)
+    return _dedupe(found)
+
+
+def load_addresses(path: str, outdir: str = ".") -> List[str]:
+    """Read locations from a CSV, a text file (one per line), an SOV Fixer JSON
+    output, or a raw SOV (PDF/Excel), which is sent through SOV Fixer first."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            rows = list(csv.DictReader(fh))
+        addrs = [_address_from_record(r) for r in rows]
+        if not any(addrs) and rows:
+            # No recognisable header: treat the first column as the address
+            first = next(iter(rows[0].keys()))
+            addrs = [r[first] for r in rows]
+            if any(ch.isdigit() for ch in first):
+                # Headerless file: DictReader consumed the first address as the header
+                addrs.insert(0, first)
+        return _dedupe(a.strip() for a in addrs if a and a.strip())
+    if ext == ".txt":
+        with open(path, encoding="utf-8") as fh:
+            return _dedupe(line.strip() for line in fh if line.strip())
+    if ext == ".json":
+        with open(path, encoding="utf-8") as fh:
+            return addresses_from_sov_json(json.load(fh))
+    if ext in (".pdf", ".xls", ".xlsx"):
+        from gord.sovfixer import start_and_poll
+
+        ok, _, outputs = start_and_poll(path, env="staging", interval=2.5, timeout=900, outdir=outdir)
+        json_paths = [p for p in outputs if str(p).lower().endswith(".json")]
+        if not ok or not json_paths:
+            raise RuntimeError("SOV processing failed or produced no JSON output.")
+        with open(json_paths[0], encoding="utf-8") as fh:
+            return addresses_from_sov_json(json.load(fh))
+    raise ValueError(f"Unsupported input file type: {ext or path}")
+
+
+async def _run_location(row: int, address: str, intent: Intent, retries: int, agent_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    # Each location runs in its own asyncio task, so these only affect this row
+    set_quiet(True)
+    query = INTENT_QUERIES[intent].format(address=address)
+    route = RouteDecision(intent=intent, address=address, rationale="Batch run")
+    t0 = time.monotonic()
+    answer = None
+    error = None
+    attempts = 0
+    budget = {}
+    while attempts <= retries:
+        attempts += 1
+        agent = AsyncAgent(**agent_kwargs)
+        try:
+            answer = await agent.run(query, route_decision=route)
+            if answer:
+                error = None
+                break
+            error = "Run aborted before an answer was generated."
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            budget = agent.budget.summary()
+        if attempts <= retries:
+            await asyncio.sleep(min(2 ** attempts, 30))
+    return {
+        "row": row,
+        "address": address,
+        "intent": intent.value,
+        "status": "ok" if error is None else "failed",
+        "attempts": attempts,
+        "seconds": round(time.monotonic() - t0, 2),
+        "answer": answer if error is None else None,
+        "error": error,
+        "metrics": metrics.snapshot(),
+        "budget": budget,
+    }
+
+
+class _OutputWriter:
+    """Appends result rows to a .jsonl or .csv file as they complete.
+
+    In CSV, nested values (metrics, budget, ...) are written as JSON.
+    """
+
+    def __init__(self, path: str, fieldnames: List[str] = OUTPUT_FIELDS):
+        self.path = path
+        self._fh = open(path, "w", newline="", encoding="utf-8")
+        self._csv = None
+        if path.lower().endswith(".csv"):
+            self._csv = csv.DictWriter(self._fh, fieldnames=fieldnames, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, result: Dict[str, Any]):
+        if self._csv:
+            self._csv.writerow({k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in result.items()})
+        else:
+            self._fh.write(json.dumps(result) + "\n")
+        self._fh.flush()
+
+    def close(self):
+        self._fh.close()
+
+
+def _print_progress(result: Dict[str, Any], done: int, total: int, elapsed: float):
+    rate = done / elapsed * 60 if elapsed > 0 else 0.0
+    UI().print_info(
+        f"[{done}/{total}] {result['status']:<6} {result['address']} "
+        f"({result['seconds']}s, {result['attempts']} attempt(s)) | {rate:.1f} locations/min"
+    )
+
+
+async def run_batch(
+    addresses: List[str],
+    intent: Intent,
+    concurrency: int = BATCH_CONCURRENCY,
+    retries: int = BATCH_RETRIES,
+    output_path: Optional[str] = None,
+    on_progress: Optional[Callable[[Dict[str, Any], int, int, float], None]] = _print_progress,
+    agent_kwargs: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Run one report per address with at most `concurrency` sessions in flight.
+
+    Failed rows are retried up to `retries` times with exponential backoff.
+    Rows are written to `output_path` (.jsonl or .csv) as they complete.
+    Returns a summary whose headline figure is locations_per_minute.
+    """
+    if intent not in INTENT_QUERIES:
+        raise ValueError(f"Batch runs need an address intent, got {intent}")
+    slots = asyncio.Semaphore(max(1, concurrency))
+    # Rows are retried here and their results land in the output file; a
+    # checkpoint per location would only pile up in the runs directory
+    agent_kwargs = {"checkpoints": False, **(agent_kwargs or {})}
+
+    async def bounded(row: int, address: str):
+        async with slots:
+            return await _run_location(row, address, intent, retries, agent_kwargs)
+
+    writer = _OutputWriter(output_path) if output_path else None
+    t0 = time.monotonic()
+    ok = failed = 0
+    pending: List[asyncio.Task] = []
+    try:
+        pending = [asyncio.create_task(bounded(i, a)) for i, a in enumerate(addresses, 1)]
+        for done, fut in enumerate(asyncio.as_completed(pending), 1):
+            result = await fut
+            if result["status"] == "ok":
+                ok += 1
+            else:
+                failed += 1
+            if writer:
+                writer.write(result)
+            if on_progress:
+                on_progress(result, done, len(addresses), time.monotonic() - t0)
+    finally:
+        for task in pending:
+            task.cancel()
+        if writer:
+            writer.close()
+
+    elapsed = time.monotonic() - t0
+    return {
+        "locations": len(addresses),
+        "ok": ok,
+        "failed": failed,
+        "seconds": round(elapsed, 2),
+        "locations_per_minute": round(len(addresses) / elapsed * 60, 2) if elapsed > 0 else 0.0,
+        "output": output_path,
+    }
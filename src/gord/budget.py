@@ -0,0 +1,129 @@
+import contextvars
+import time
+from typing import Dict, Optional
+
+from gord import metrics
+from gord.settings import (
+    BUDGET_MAX_SECONDS,
+    BUDGET_MAX_PROMPT_TOKENS,
+    BUDGET_MAX_COMPLETION_TOKENS,
+    BUDGET_MAX_LLM_CALLS,
+    BUDGET_MAX_CALLS,
+    BUDGET_SOFT_FRACTION,
+)
+
+
+# Metric counted for each call of a tool
+TOOL_PROVIDERS = {
+    "ping_aoa_search": "ping_aoa",
+    "brave_search": "brave",
+    "google_web_search": "google_web",
+    "google_image_search": "google_image",
+}
+
+
+def parse_call_limits(spec: str) -> Dict[str, int]:
+    """Parse "google_web=10,brave=5" into {"google_web": 10, "brave": 5}."""
+    limits: Dict[str, int] = {}
+    for part in (spec or "").split(","):
+        name, _, n = part.partition("=")
+        if name.strip() and n.strip().isdigit():
+            limits[name.strip()] = int(n)
+    return limits
+
+
+class Budget:
+    """Resource ceilings for one run, measured against the run's metrics.
+
+    A limit of 0 (or None) means unlimited. `level()` is "ok", "tight" once
+    any limit passes `soft_fraction`, and "exhausted" once one is reached.
+    """
+
+    def __init__(
+        self,
+        max_seconds: float = BUDGET_MAX_SECONDS,
+        max_prompt_tokens: int = BUDGET_MAX_PROMPT_TOKENS,
+        max_completion_tokens: int = BUDGET_MAX_COMPLETION_TOKENS,
+        max_llm_calls: int = BUDGET_MAX_LLM_CALLS,
+        max_calls: Optional[Dict[str, int]] = None,
+        soft_fraction: float = BUDGET_SOFT_FRACTION,
+    ):
+        self.max_seconds = max_seconds or 0
+        self.max_prompt_tokens = max_prompt_tokens or 0
+        self.max_completion_tokens = max_completion_tokens or 0
+        self.max_llm_calls = max_llm_calls or 0
+        self.max_calls = parse_call_limits(BUDGET_MAX_CALLS) if max_calls is None else dict(max_calls)
+        self.soft_fraction = soft_fraction
+        self.started_at = time.monotonic()
+
+    def started(self) -> "Budget":
+        """Same limits with the clock starting now, for a new run."""
+        return Budget(
+            self.max_seconds,
+            self.max_prompt_tokens,
+            self.max_completion_tokens,
+            self.max_llm_calls,
+            self.max_calls,
+            self.soft_fraction,
+        )
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining_seconds(self) -> Optional[float]:
+        if not self.max_seconds:
+            return None
+        return max(0.0, self.max_seconds - self.elapsed())
+
+    def _usage(self) -> Dict[str, tuple]:
+        """(used, limit) for every run-wide limit that is set."""
+        counts = metrics.snapshot()
+        usage = {
+            "seconds": (round(self.elapsed(), 1), self.max_seconds),
+            "prompt_tokens": (counts.get("openai_prompt_tokens", 0), self.max_prompt_tokens),
+            "completion_tokens": (counts.get("openai_completion_tokens", 0), self.max_completion_tokens),
+            "llm_calls": (counts.get("openai", 0), self.max_llm_calls),
+        }
+        return {k: v for k, v in usage.items() if v[1]}
+
+    def level(self) -> str:
+        level = "ok"
+        for used, limit in self._usage().values():
+            if used >= limit:
+                return "exhausted"
+            if used >= limit * self.soft_fraction:
+                level = "tight"
+        return level
+
+    def exhausted(self) -> bool:
+        return self.level() == "exhausted"
+
+    def tight(self) -> bool:
+        return self.level() != "ok"
+
+    def allows_tool(self, tool_name: str) -> bool:
+        """Whether another call of this tool fits its provider's call ceiling."""
+        provider = TOOL_PROVIDERS.get(tool_name, tool_name)
+        limit = self.max_calls.get(provider)
+        return not limit or metrics.snapshot().get(provider, 0) < limit
+
+    def summary(self) -> Dict[str, str]:
+        """Used/limit per budgeted resource, for the end-of-run report."""
+        counts = metrics.snapshot()
+        out = {k: f"{used}/{limit}" for k, (used, limit) in self._usage().items()}
+        for provider, limit in self.max_calls.items():
+            out[f"{provider}_calls"] = f"{counts.get(provider, 0)}/{limit}"
+        return out
+
+
+# Budget of the run executing in this context; tool bodies consult it for
+# their provider ceilings. Outside a run the configured defaults apply.
+_CURRENT: contextvars.ContextVar[Optional[Budget]] = contextvars.ContextVar("gord_budget", default=None)
+
+
+def current_budget() -> Budget:
+    return _CURRENT.get() or Budget()
+
+
+def set_current_budget(budget: Optional[Budget]) -> contextvars.Token:
+    return _CURRENT.set(budget)
@@ -0,0 +1,122 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from gord import metrics
+from gord.settings import CACHE_PATH
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class SqliteCache:
+    """Persistent JSON cache with a TTL and LRU eviction, one namespace per use.
+
+    Backed by a SQLite file in WAL mode, so concurrent processes (batch
+    workers, several CLIs) share entries safely. Each thread gets its own
+    connection. Storage errors are treated as misses: a broken cache must
+    never fail a run.
+
+    Hits and misses are counted as `<namespace>_cache_hit` / `_cache_miss`.
+    """
+
+    def __init__(self, namespace: str, ttl: float, max_entries: int, path: str = CACHE_PATH, bypass: bool = False):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        # Skip reads but keep writing, to refresh entries
+        self.bypass = bypass
+        self._local = threading.local()
+        self._writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled or self.bypass:
+            return None
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, created_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+                row = None
+            if row is None:
+                metrics.increment(f"{self.namespace}_cache_miss", 1)
+                return None
+            conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+            value = json.loads(row[0])
+        except (sqlite3.Error, ValueError, OSError):
+            metrics.increment(f"{self.namespace}_cache_miss", 1)
+            return None
+        metrics.increment(f"{self.namespace}_cache_hit", 1)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        now = time.time()
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, default=str), now, now),
+            )
+            self._writes += 1
+            # Eviction scans the namespace; doing it every 50 writes keeps sets cheap
+            if self._writes % 50 == 1:
+                self._evict(conn)
+        except (sqlite3.Error, TypeError, ValueError, OSError):
+            pass
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND created_at < ?",
+            (self.namespace, time.time() - self.ttl),
+        )
+        conn.execute(
+            """DELETE FROM cache WHERE namespace = ? AND key IN (
+                   SELECT key FROM cache WHERE namespace = ?
+                   ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)""",
+            (self.namespace, self.namespace, self.max_entries),
+        )
+
+    def clear(self) -> None:
+        try:
+            self._conn().execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,89 @@
+import contextvars
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+class OperationCancelled(Exception):
+    """Raised by blocking code (polling loops, paged fetches) when its token is cancelled."""
+
+
+class CancelToken:
+    """Thread-safe, one-shot cancellation signal.
+
+    `cancel()` may be called from any thread (e.g. a key binding). Callbacks
+    registered with `on_cancel` run at that moment, which is how a running
+    asyncio task gets cancelled mid-request instead of at the next step.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for cb in callbacks:
+            try:
+                cb()
+            except Exception:
+                pass
+
+    def on_cancel(self, cb: Callable[[], None]) -> Callable[[], None]:
+        """Run `cb` on cancel (now, if already cancelled). Returns an unregister function."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(cb)
+                return lambda: self._remove(cb)
+        cb()
+        return lambda: None
+
+    def _remove(self, cb: Callable[[], None]) -> None:
+        with self._lock:
+            if cb in self._callbacks:
+                self._callbacks.remove(cb)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to `timeout` seconds, waking early on cancel. True if cancelled."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise OperationCancelled("Operation cancelled.")
+
+
+# Token of the agent session running in this context, for code that cannot
+# take a token argument (tool bodies called through langchain)
+_CURRENT: contextvars.ContextVar[Optional[CancelToken]] = contextvars.ContextVar("gord_cancel_token", default=None)
+
+
+def current_token() -> Optional[CancelToken]:
+    return _CURRENT.get()
+
+
+def set_current_token(token: Optional[CancelToken]) -> contextvars.Token:
+    return _CURRENT.set(token)
+
+
+def raise_if_cancelled() -> None:
+    """Check the current session's token, if any."""
+    token = _CURRENT.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep that wakes early and raises if the current session is cancelled."""
+    token = _CURRENT.get()
+    if token is None:
+        time.sleep(seconds)
+    elif token.wait(seconds):
+        token.raise_if_cancelled()
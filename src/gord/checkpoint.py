@@ -0,0 +1,79 @@
+import json
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from gord.observations import Observation
+from gord.schemas import RouteDecision, Task
+from gord.settings import CHECKPOINT_DIR
+
+
+class RunCheckpoint(BaseModel):
+    """Everything needed to pick a run up where it stopped."""
+    run_id: str
+    query: str
+    status: str = Field("running", description="running, completed, cancelled, aborted or failed.")
+    route_decision: Optional[RouteDecision] = None
+    tasks: Optional[List[Task]] = Field(None, description="Planned tasks with done flags; None until planning finished.")
+    observations: List[Observation] = Field(default_factory=list)
+    step_count: int = 0
+    metrics: Dict[str, int] = Field(default_factory=dict)
+    answer: Optional[str] = None
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+
+
+def new_run_id() -> str:
+    return time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+
+
+def checkpoint_path(run_id: str, directory: str = CHECKPOINT_DIR) -> str:
+    # Run IDs come from the user on resume; keep them inside the directory
+    return os.path.join(directory, f"{os.path.basename(run_id)}.json")
+
+
+def save_checkpoint(cp: RunCheckpoint, directory: str = CHECKPOINT_DIR) -> str:
+    """Write the checkpoint atomically (temp file + rename) and return its path."""
+    os.makedirs(directory, exist_ok=True)
+    cp.updated_at = time.time()
+    path = checkpoint_path(cp.run_id, directory)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(cp.model_dump_json())
+    os.replace(tmp, path)
+    return path
+
+
+def load_checkpoint(run_id: str, directory: str = CHECKPOINT_DIR) -> RunCheckpoint:
+    path = checkpoint_path(run_id, directory)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No checkpoint for run {run_id} in {directory}")
+    with open(path, encoding="utf-8") as fh:
+        return RunCheckpoint.model_validate(json.load(fh))
+
+
+def list_checkpoints(directory: str = CHECKPOINT_DIR) -> List[Dict[str, Any]]:
+    """Summaries of saved runs, most recently updated first."""
+    if not os.path.isdir(directory):
+        return []
+    out = []
+    for name in os.listdir(directory):
+        if not name.endswith(".json"):
+            continue
+        try:
+            cp = load_checkpoint(name[:-5], directory)
+        except Exception:
+            continue
+        done = sum(1 for t in cp.tasks or [] if t.done)
+        out.append({
+            "run_id": cp.run_id,
+            "status": cp.status,
+            "query": cp.query,
+            "tasks_done": done,
+            "tasks": len(cp.tasks or []),
+            "updated_at": cp.updated_at,
+        })
+    return sorted(out, key=lambda r: r["updated_at"], reverse=True)
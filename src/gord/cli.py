@@ -3,6 +3,10 @@ from dotenv import load_dotenv
 # Load environment variables BEFORE importing any dexter modules
 load_dotenv()
 
+import argparse
+import asyncio
+import sys
+
 from gord.agent import Agent
 from gord.utils.intro import print_intro
 from prompt_toolkit import PromptSession
@@ -11,7 +15,12 @@ from prompt_toolkit.history import InMemoryHistory
 from gord.doc_ingest import extract_dropped_file, summarize_pdf
 from gord.sovfixer import start_and_poll
 from gord.model import call_llm
-from gord.schemas import Answer, SOVIntake
+from gord.schemas import Answer, SOVIntake, Intent
+from gord.checkpoint import list_checkpoints
+from gord.cancel import OperationCancelled
+from gord.batch import INTENT_QUERIES, load_addresses, run_batch
+from gord.enhance import run_enhance
+from gord.settings import BATCH_CONCURRENCY, BATCH_RETRIES, ENHANCE_CONCURRENCY, ENHANCE_RETRIES
 from gord.prompts import SOV_PARSE_SYSTEM_PROMPT
 from gord import metrics
 
@@ -43,7 +52,9 @@ def generate_help_text():
         "Commands:\n"
         "- help: show examples and commands\n"
         "- exit/quit: leave\n"
-        "- cancel/stop: request to stop current run (takes effect between steps)\n"
+        "- cancel/stop: stop the current run, aborting in-flight requests\n"
+        "- runs: list saved runs\n"
+        "- resume <run_id>: continue a cancelled or failed run from its last checkpoint\n"
         "Shortcuts:\n"
         "- ESC: request cancel (same as 'cancel')\n"
         "Examples:\n"
@@ -54,7 +65,90 @@ def generate_help_text():
 
 HELP_TEXT = generate_help_text()
 
-def main():
+def batch_main(argv):
+    """`gord-agent batch`: run one report per location in an SOV or address list."""
+    parser = argparse.ArgumentParser(prog="gord-agent batch", description="Run the agent for every location in an SOV or address file.")
+    parser.add_argument("input", help="SOV (PDF/Excel), SOV Fixer JSON output, CSV of addresses, or a text file with one address per line")
+    parser.add_argument("--intent", default=Intent.UNDERWRITING_REPORT.value, choices=[i.value for i in INTENT_QUERIES], help="Report type to run for each location")
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY, help="Agent sessions in flight at once")
+    parser.add_argument("--retries", type=int, default=BATCH_RETRIES, help="Retries for a failed location")
+    parser.add_argument("--output", default="batch_results.jsonl", help="Results file (.jsonl or .csv)")
+    parser.add_argument("--limit", type=int, default=None, help="Only run the first N locations")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached Ping results and fetch fresh ones")
+    args = parser.parse_args(argv)
+
+    if args.refresh_cache:
+        from gord.tools import PING_CACHE
+        PING_CACHE.bypass = True
+
+    addresses = load_addresses(args.input)
+    if args.limit is not None:
+        addresses = addresses[: args.limit]
+    if not addresses:
+        print("No addresses found in input.")
+        return 1
+    print(f"Running {args.intent} for {len(addresses)} location(s), concurrency {args.concurrency}...")
+    summary = asyncio.run(run_batch(
+        addresses,
+        Intent(args.intent),
+        concurrency=args.concurrency,
+        retries=args.retries,
+        output_path=args.output,
+    ))
+    print(
+        f"\n{summary['locations_per_minute']} locations/min | "
+        f"{summary['ok']} ok, {summary['failed']} failed of {summary['locations']} in {summary['seconds']}s\n"
+        f"Results written to {summary['output']}"
+    )
+    return 0 if summary["failed"] == 0 else 2
+
+
+def enhance_main(argv):
+    """`gord-agent enhance`: Ping AOA enhancement for every location, without the agent."""
+    parser = argparse.ArgumentParser(prog="gord-agent enhance", description="Enhance every location in an SOV or address file via Ping AOA.")
+    parser.add_argument("input", help="SOV (PDF/Excel), SOV Fixer JSON output, CSV or text file of addresses")
+    parser.add_argument("--concurrency", type=int, default=ENHANCE_CONCURRENCY, help="Enhance requests in flight at once")
+    parser.add_argument("--retries", type=int, default=ENHANCE_RETRIES, help="Retries for a failed address")
+    parser.add_argument("--output", default="enhance_results.jsonl", help="Results file (.jsonl or .csv)")
+    parser.add_argument("--limit", type=int, default=None, help="Only enhance the first N locations")
+    parser.add_argument("--full", action="store_true", help="Include the full response (minus raw provider payloads) in each row")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached Ping results and fetch fresh ones")
+    args = parser.parse_args(argv)
+
+    if args.refresh_cache:
+        from gord.tools import PING_CACHE
+        PING_CACHE.bypass = True
+
+    addresses = load_addresses(args.input)
+    if args.limit is not None:
+        addresses = addresses[: args.limit]
+    if not addresses:
+        print("No addresses found in input.")
+        return 1
+    print(f"Enhancing {len(addresses)} location(s), concurrency {args.concurrency}...")
+    summary = asyncio.run(run_enhance(
+        addresses,
+        concurrency=args.concurrency,
+        retries=args.retries,
+        output_path=args.output,
+        full=args.full,
+    ))
+    print(
+        f"\n{summary['addresses_per_second']} addresses/s | "
+        f"{summary['ok']} ok, {summary['partial']} partial, {summary['failed']} failed of {summary['addresses']} in {summary['seconds']}s\n"
+        f"Latency p50 {summary['latency_p50']}s, p90 {summary['latency_p90']}s, p99 {summary['latency_p99']}s\n"
+        f"Results written to {summary['output']}"
+    )
+    return 0 if summary["failed"] == 0 else 2
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "batch":
+        return batch_main(argv[1:])
+    if argv and argv[0] == "enhance":
+        return enhance_main(argv[1:])
+
     print_intro()
     agent = Agent()
 
@@ -70,9 +164,9 @@ def main():
 
     @kb.add('escape')
     def _(event):
-        # Request cancel; will be picked up between steps
+        # Request cancel; aborts the in-flight request of a running session
         agent.request_cancel()
-        print("\nCancel requested (ESC). Will stop between steps.")
+        print("\nCancel requested (ESC).")
 
     session = PromptSession(history=InMemoryHistory(), key_bindings=kb)
 
@@ -89,9 +183,16 @@ def main():
                     print(f"File received: {fname} ({size} bytes)\nSHA256: {sha}")
                 except Exception as e:
                     print(f"Error reading file: {e}")
-                # Kick off SOVFixer async flow and download outputs
+                # Kick off SOVFixer async flow and download outputs; the
+                # agent's token lets ESC/cancel stop the poll like a run
+                agent.reset_cancel()
                 try:
-                    ok, final_resp, outputs = start_and_poll(drop_path, env="staging", interval=2.5, timeout=900, outdir=".")
+                    ok, final_resp, outputs = start_and_poll(
+                        drop_path, env="staging", interval=2.5, timeout=900, outdir=".", cancel_token=agent.cancel_token
+                    )
+                except OperationCancelled:
+                    print("SOV processing cancelled.")
+                    continue
                 except Exception as e:
                     print(f"SOVFixer error: {e}")
                     continue
@@ -197,9 +298,23 @@ def main():
             if lower in ["help", "h", "?"]:
                 print(HELP_TEXT)
                 continue
+            if lower == "runs":
+                runs = list_checkpoints()
+                if not runs:
+                    print("No saved runs.")
+                for r in runs[:20]:
+                    print(f"{r['run_id']}  {r['status']:<9} {r['tasks_done']}/{r['tasks']} tasks  {r['query'][:60]}")
+                continue
+            if lower.startswith("resume "):
+                run_id = query.strip().split(None, 1)[1]
+                try:
+                    agent.resume(run_id)
+                except FileNotFoundError as e:
+                    print(e)
+                continue
             if lower in ["cancel", "stop"]:
                 agent.request_cancel()
-                print("Cancel requested. Will stop between steps.")
+                print("Cancel requested.")
                 continue
             if query:
                 agent.run(query)
@@ -209,4 +324,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,166 @@
+import asyncio
+import math
+import random
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+import httpx
+
+from gord import http, metrics
+from gord.batch import _OutputWriter
+from gord.settings import ENHANCE_CONCURRENCY, ENHANCE_RETRIES
+from gord.tools import _aping_enhance, ping_failed_sources, project_ping_response, strip_ping_raw
+from gord.utils.ui import UI
+
+
+OUTPUT_FIELDS = ["row", "address", "status", "attempts", "seconds", "failed_sources", "error", "summary", "response"]
+
+
+def _retryable(exc: Exception) -> bool:
+    # gord.http already retried 429, 5xx and connection errors with backoff,
+    # so those are final here, and any other 4xx will not change on retry
+    return not isinstance(exc, (httpx.HTTPStatusError, *http.RETRIED_ERRORS))
+
+
+async def _enhance_one(row: int, address: str, retries: int, full: bool) -> Dict[str, Any]:
+    t0 = time.monotonic()
+    attempts = 0
+    ret = None
+    error = None
+    failed: List[str] = []
+    while attempts <= retries:
+        attempts += 1
+        try:
+            ret = await _aping_enhance(address)
+            error = None
+            failed = ping_failed_sources(ret)
+            if not failed:
+                break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if not _retryable(e):
+                break
+        if attempts <= retries:
+            await asyncio.sleep(random.uniform(0, min(2 ** attempts, 30)))
+    if ret is None:
+        status = "failed"
+    elif failed:
+        # Some sources answered (possibly on an earlier attempt); keep what came back
+        status = "partial"
+    else:
+        status = "ok"
+    return {
+        "row": row,
+        "address": address,
+        "status": status,
+        "attempts": attempts,
+        "seconds": round(time.monotonic() - t0, 3),
+        "failed_sources": failed,
+        "error": error,
+        "summary": project_ping_response(ret) if ret is not None else None,
+        "response": strip_ping_raw(ret) if full and ret is not None else None,
+    }
+
+
+async def enhance_addresses(
+    addresses: Iterable[str],
+    concurrency: int = ENHANCE_CONCURRENCY,
+    retries: int = ENHANCE_RETRIES,
+    full: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Enhance every address via Ping AOA, yielding one result row per address as it completes.
+
+    At most `concurrency` requests are in flight; the iterable is consumed
+    lazily, so it can be larger than memory. Failed addresses are retried up
+    to `retries` times with jittered backoff, as are responses where a
+    source reported failure; HTTP statuses and connection errors are left to
+    the retries in gord.http. Requests go through the Ping result cache and
+    the process-wide Ping rate limiter. With `full`, rows carry the whole
+    response (minus raw provider payloads) next to the projected summary.
+    """
+    source = iter(enumerate(addresses, 1))
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def worker():
+        for row, address in source:
+            try:
+                result = await _enhance_one(row, address, retries, full)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                result = {"row": row, "address": address, "status": "failed", "error": f"{type(e).__name__}: {e}"}
+            await results.put(result)
+        await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    try:
+        remaining = len(workers)
+        while remaining:
+            result = await results.get()
+            if result is None:
+                remaining -= 1
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[rank - 1]
+
+
+def _print_progress(result: Dict[str, Any], done: int, elapsed: float):
+    rate = done / elapsed if elapsed > 0 else 0.0
+    UI().print_info(f"[{done}] {result['status']:<7} {result['address']} ({result.get('seconds', 0)}s) | {rate:.1f} addresses/s")
+
+
+async def run_enhance(
+    addresses: Iterable[str],
+    concurrency: int = ENHANCE_CONCURRENCY,
+    retries: int = ENHANCE_RETRIES,
+    output_path: Optional[str] = None,
+    full: bool = False,
+    on_progress: Optional[Callable[[Dict[str, Any], int, float], None]] = _print_progress,
+) -> Dict[str, Any]:
+    """Run `enhance_addresses`, writing rows to `output_path` (.jsonl or .csv) as they complete.
+
+    Returns throughput and per-address latency percentiles (p50/p90/p99,
+    including retries).
+    """
+    writer = _OutputWriter(output_path, OUTPUT_FIELDS) if output_path else None
+    counts = {"ok": 0, "partial": 0, "failed": 0}
+    latencies: List[float] = []
+    t0 = time.monotonic()
+    try:
+        async for result in enhance_addresses(addresses, concurrency, retries, full):
+            counts[result["status"]] += 1
+            latencies.append(result.get("seconds", 0.0))
+            if writer:
+                writer.write(result)
+            if on_progress:
+                on_progress(result, len(latencies), time.monotonic() - t0)
+    finally:
+        if writer:
+            writer.close()
+
+    elapsed = time.monotonic() - t0
+    return {
+        "addresses": len(latencies),
+        **counts,
+        "seconds": round(elapsed, 2),
+        "addresses_per_second": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_p50": round(percentile(latencies, 50), 3),
+        "latency_p90": round(percentile(latencies, 90), 3),
+        "latency_p99": round(percentile(latencies, 99), 3),
+        "metrics": metrics.snapshot(),
+        "output": output_path,
+    }
@@ -0,0 +1,148 @@
+import asyncio
+import email.utils
+import os
+import random
+import threading
+import time
+import weakref
+from contextlib import nullcontext
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from gord import metrics
+from gord import cancel
+from gord.ratelimit import RateLimiter
+from gord.settings import HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX
+
+
+# Worth retrying: rate limited, or the server/gateway failed transiently
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Async transport errors retried by `arequest`
+RETRIED_ERRORS = (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError)
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_PID: Optional[int] = None
+_SESSION_LOCK = threading.Lock()
+
+# httpx clients are bound to the event loop that first used them, and the
+# sync Agent runs each query in a fresh asyncio.run loop
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session; safe to share between threads for plain requests."""
+    global _SESSION, _SESSION_PID
+    pid = os.getpid()
+    if _SESSION is None or _SESSION_PID != pid:
+        with _SESSION_LOCK:
+            if _SESSION is None or _SESSION_PID != pid:
+                # A forked child must not reuse the parent's sockets
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION, _SESSION_PID = session, pid
+    return _SESSION
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Keep-alive httpx client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        limits = httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+        client = httpx.AsyncClient(limits=limits)
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry number `attempt` (0-based).
+
+    Honors a Retry-After header (seconds or HTTP date); otherwise full-jitter
+    exponential backoff. Both are capped at HTTP_BACKOFF_MAX.
+    """
+    if retry_after:
+        try:
+            return min(HTTP_BACKOFF_MAX, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+            return min(HTTP_BACKOFF_MAX, max(0.0, when.timestamp() - time.time()))
+        except (TypeError, ValueError):
+            pass
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+
+def request(
+    method: str,
+    url: str,
+    retries: int = HTTP_RETRIES,
+    limiter: Optional[RateLimiter] = None,
+    **kwargs,
+) -> requests.Response:
+    """`requests` call over the shared pool, retrying 429/5xx and connection errors.
+
+    Each attempt goes through `limiter`, if given, and a 429 pauses that
+    limiter for every caller. The last response is returned as-is (callers
+    still `raise_for_status()`); the last connection error is re-raised.
+    """
+    session = get_session()
+    for attempt in range(retries + 1):
+        try:
+            with limiter.acquire() if limiter else nullcontext():
+                response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= retries:
+                raise
+            delay = retry_delay(attempt)
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+            delay = retry_delay(attempt, response.headers.get("Retry-After"))
+            if limiter and response.status_code == 429:
+                limiter.pause(delay)
+            response.close()
+        metrics.increment("http_retry", 1)
+        cancel.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+async def arequest(
+    method: str,
+    url: str,
+    retries: int = HTTP_RETRIES,
+    limiter: Optional[RateLimiter] = None,
+    **kwargs,
+) -> httpx.Response:
+    """Async twin of `request`, over the loop's shared httpx client."""
+    client = get_async_client()
+    for attempt in range(retries + 1):
+        try:
+            async with limiter.aacquire() if limiter else nullcontext():
+                response = await client.request(method, url, **kwargs)
+        except RETRIED_ERRORS:
+            if attempt >= retries:
+                raise
+            delay = retry_delay(attempt)
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+            delay = retry_delay(attempt, response.headers.get("Retry-After"))
+            if limiter and response.status_code == 429:
+                limiter.pause(delay)
+        metrics.increment("http_retry", 1)
+        await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+async def aget(url: str, **kwargs) -> httpx.Response:
+    return await arequest("GET", url, **kwargs)
@@ -1,17 +1,32 @@
+import contextvars
+import threading
 from collections import defaultdict
 from typing import Dict
 
-_COUNTS: Dict[str, int] = defaultdict(int)
+# Counters are scoped per agent session: reset() installs a fresh dict in the
+# current context, so concurrent sessions on one event loop (each running in
+# its own asyncio task) do not see each other's counts. Work started from a
+# session (tasks, to_thread, copied contexts) shares the session's dict.
+_COUNTS: contextvars.ContextVar[Dict[str, int]] = contextvars.ContextVar("gord_metrics", default=defaultdict(int))
+_LOCK = threading.Lock()
 
 
 def increment(service: str, n: int = 1) -> None:
-    _COUNTS[service] += int(n)
+    with _LOCK:
+        _COUNTS.get()[service] += int(n)
 
 
 def snapshot() -> Dict[str, int]:
-    return dict(_COUNTS)
+    with _LOCK:
+        return dict(_COUNTS.get())
 
 
 def reset() -> None:
-    _COUNTS.clear()
+    _COUNTS.set(defaultdict(int))
 
+
+def restore(counts: Dict[str, int]) -> None:
+    """Start the current session's counters from earlier counts (resumed runs)."""
+    fresh = defaultdict(int)
+    fresh.update({k: int(v) for k, v in (counts or {}).items()})
+    _COUNTS.set(fresh)
@@ -1,14 +1,23 @@
+import hashlib
+import json
 import os
+import time
+import threading
+from collections import OrderedDict
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from pydantic import BaseModel
-from typing import Type, List, Optional
+from typing import Any, Callable, Type, List, Optional
 from langchain_core.tools import BaseTool
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, message_to_dict, messages_from_dict
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
 from gord.prompts import DEFAULT_SYSTEM_PROMPT
+from gord.cache import SqliteCache
+from gord.ratelimit import limiter
+from gord.settings import LLM_CACHE_MODE, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES, OPENAI_COMPLETION_TOKENS_ESTIMATE
 from gord import metrics
 
 llm = ChatOpenAI(
@@ -19,6 +28,9 @@ llm = ChatOpenAI(
 )
 
 class _MetricsCallback(BaseCallbackHandler):
+    # Record usage on the caller's thread/context so per-session metrics see it
+    run_inline = True
+
     def on_llm_end(self, response: LLMResult, **kwargs) -> None:
         try:
             out = response.llm_output or {}
@@ -34,6 +46,10 @@ class _MetricsCallback(BaseCallbackHandler):
                 or usage.get("completionTokens")
             )
             total_tokens = usage.get("total_tokens") or usage.get("totalTokens")
+            # Prompt tokens served from the provider's prefix cache
+            cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+            if isinstance(cached_tokens, int):
+                metrics.increment("openai_cached_tokens", cached_tokens)
             if isinstance(prompt_tokens, int):
                 metrics.increment("openai_prompt_tokens", prompt_tokens)
             if isinstance(completion_tokens, int):
@@ -46,12 +62,23 @@ class _MetricsCallback(BaseCallbackHandler):
             # Do not fail the run if usage metadata shape changes
             pass
 
-def call_llm(
-    prompt: str,
+# Stateless, so one instance serves every call
+_METRICS_CALLBACK = _MetricsCallback()
+
+# Compiled chains keyed by call shape. Building one converts the output
+# schema / tool schemas to OpenAI JSON schemas, which is pure overhead when
+# the same shape is used on every step of every run.
+_CHAIN_CACHE_SIZE = 128
+_CHAIN_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_CHAIN_CACHE_LOCK = threading.Lock()
+
+def _build_chain(
     system_prompt: Optional[str] = None,
     output_schema: Optional[Type[BaseModel]] = None,
     tools: Optional[List[BaseTool]] = None,
-) -> AIMessage:
+    tool_choice: Optional[str] = None,
+    stream_usage: bool = False,
+):
   final_system_prompt = system_prompt if system_prompt else DEFAULT_SYSTEM_PROMPT
   
   prompt_template = ChatPromptTemplate.from_messages([
@@ -59,13 +86,177 @@ def call_llm(
       ("user", "{prompt}")
   ])
 
-  runnable = llm
+  # stream_usage makes the last streamed chunk carry token usage
+  runnable = llm.bind(stream_usage=True) if stream_usage else llm
   if output_schema:
       runnable = llm.with_structured_output(output_schema)
   elif tools:
-      runnable = llm.bind_tools(tools)
+      runnable = llm.bind_tools(tools, tool_choice=tool_choice) if tool_choice else llm.bind_tools(tools)
   
-  chain = prompt_template | runnable
+  return prompt_template | runnable
+
+def _compiled_chain(
+    system_prompt: Optional[str] = None,
+    output_schema: Optional[Type[BaseModel]] = None,
+    tools: Optional[List[BaseTool]] = None,
+    tool_choice: Optional[str] = None,
+    stream_usage: bool = False,
+):
+  """_build_chain, cached by (system prompt, output schema, tool set, tool_choice)."""
+  tools = tuple(tools or ())
+  # Tools are keyed by identity; the cache entry keeps them alive so ids stay unique
+  tool_key = tuple((getattr(t, "name", None) or getattr(t, "__name__", repr(t)), id(t)) for t in tools)
+  key = (system_prompt, output_schema, tool_key, tool_choice, stream_usage)
+  with _CHAIN_CACHE_LOCK:
+      hit = _CHAIN_CACHE.get(key)
+      if hit is not None:
+          _CHAIN_CACHE.move_to_end(key)
+          return hit[0]
+  chain = _build_chain(system_prompt, output_schema, list(tools) or None, tool_choice, stream_usage)
+  with _CHAIN_CACHE_LOCK:
+      _CHAIN_CACHE[key] = (chain, tools)
+      _CHAIN_CACHE.move_to_end(key)
+      while len(_CHAIN_CACHE) > _CHAIN_CACHE_SIZE:
+          _CHAIN_CACHE.popitem(last=False)
+  return chain
+
+# Record/replay cache of model responses. With temperature=0 a stored
+# response is a faithful stand-in, which makes reruns near-instant and
+# gives benchmarks a deterministic base.
+LLM_CACHE = SqliteCache("llm", LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES)
+
+def _llm_cache_key(
+    kind: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    output_schema: Optional[Type[BaseModel]] = None,
+    tools: Optional[List[BaseTool]] = None,
+    tool_choice: Optional[str] = None,
+) -> Optional[str]:
+  """Key over everything that shapes the response, or None when the cache is off."""
+  if LLM_CACHE_MODE == "off":
+      return None
+  parts = {
+      "kind": kind,
+      "model": llm.model_name,
+      "temperature": llm.temperature,
+      "system": system_prompt or DEFAULT_SYSTEM_PROMPT,
+      "prompt": prompt,
+      "schema": output_schema.model_json_schema() if output_schema else None,
+      "tools": [convert_to_openai_tool(t) for t in tools or ()],
+      "tool_choice": tool_choice,
+  }
+  return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+def _llm_cache_get(key: Optional[str], output_schema: Optional[Type[BaseModel]] = None) -> Any:
+  if key is None or LLM_CACHE_MODE != "replay":
+      return None
+  entry = LLM_CACHE.get(key)
+  if entry is None:
+      return None
+  try:
+      if entry["kind"] == "structured":
+          return output_schema.model_validate(entry["data"])
+      if entry["kind"] == "message":
+          return messages_from_dict([entry["data"]])[0]
+      return entry["data"]
+  except Exception:
+      # Stored shape no longer matches (schema changed); treat as a miss
+      return None
+
+def _llm_cache_put(key: Optional[str], response: Any) -> None:
+  if key is None or response is None:
+      return
+  # AIMessage is itself a pydantic model, so it is checked first
+  if isinstance(response, AIMessage):
+      entry = {"kind": "message", "data": message_to_dict(response)}
+  elif isinstance(response, BaseModel):
+      entry = {"kind": "structured", "data": response.model_dump(mode="json")}
+  else:
+      entry = {"kind": "text", "data": response}
+  LLM_CACHE.set(key, entry)
+
+def _estimate_tokens(prompt: str, system_prompt: Optional[str]) -> int:
+  """Rough request size for the tokens-per-minute limiter (~4 characters per token)."""
+  return (len(prompt) + len(system_prompt or DEFAULT_SYSTEM_PROMPT)) // 4 + OPENAI_COMPLETION_TOKENS_ESTIMATE
+
+def call_llm(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    output_schema: Optional[Type[BaseModel]] = None,
+    tools: Optional[List[BaseTool]] = None,
+    tool_choice: Optional[str] = None,
+) -> AIMessage:
+  key = _llm_cache_key("invoke", prompt, system_prompt, output_schema, tools, tool_choice)
+  cached = _llm_cache_get(key, output_schema)
+  if cached is not None:
+      return cached
+  chain = _compiled_chain(system_prompt, output_schema, tools, tool_choice)
+  metrics.increment('openai', 1)
+  with limiter("openai").acquire(tokens=_estimate_tokens(prompt, system_prompt)):
+      response = chain.invoke({"prompt": prompt}, config={"callbacks": [_METRICS_CALLBACK]})
+  _llm_cache_put(key, response)
+  return response
+
+async def acall_llm(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    output_schema: Optional[Type[BaseModel]] = None,
+    tools: Optional[List[BaseTool]] = None,
+    tool_choice: Optional[str] = None,
+) -> AIMessage:
+  """Async counterpart of call_llm; awaits the model without blocking the event loop."""
+  key = _llm_cache_key("invoke", prompt, system_prompt, output_schema, tools, tool_choice)
+  cached = _llm_cache_get(key, output_schema)
+  if cached is not None:
+      return cached
+  chain = _compiled_chain(system_prompt, output_schema, tools, tool_choice)
+  metrics.increment('openai', 1)
+  async with limiter("openai").aacquire(tokens=_estimate_tokens(prompt, system_prompt)):
+      response = await chain.ainvoke({"prompt": prompt}, config={"callbacks": [_METRICS_CALLBACK]})
+  _llm_cache_put(key, response)
+  return response
+
+async def astream_llm(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+) -> str:
+  """Stream a plain-text completion, calling on_token for each text chunk.
+
+  Returns the full text. Records time-to-first-token as answer_ttft_ms.
+  """
+  key = _llm_cache_key("stream", prompt, system_prompt)
+  cached = _llm_cache_get(key)
+  if cached is not None:
+      # Replayed answers arrive in one piece
+      if on_token:
+          on_token(cached)
+      return cached
+  chain = _compiled_chain(system_prompt, stream_usage=True)
   metrics.increment('openai', 1)
-  cb = _MetricsCallback()
-  return chain.invoke({"prompt": prompt}, config={"callbacks": [cb]})
+  t0 = time.monotonic()
+  parts: List[str] = []
+  # Usage is read from the final chunk; the llm_output path used by
+  # _MetricsCallback is empty for streamed responses
+  async with limiter("openai").aacquire(tokens=_estimate_tokens(prompt, system_prompt)):
+    async for chunk in chain.astream({"prompt": prompt}):
+        usage = getattr(chunk, "usage_metadata", None) or {}
+        if usage:
+            metrics.increment("openai_prompt_tokens", usage.get("input_tokens", 0))
+            metrics.increment("openai_completion_tokens", usage.get("output_tokens", 0))
+            metrics.increment("openai_total_tokens", usage.get("total_tokens", 0))
+            cache_read = (usage.get("input_token_details") or {}).get("cache_read")
+            if isinstance(cache_read, int):
+                metrics.increment("openai_cached_tokens", cache_read)
+        text = chunk.content if isinstance(chunk.content, str) else ""
+        if not text:
+            continue
+        if not parts:
+            metrics.increment("answer_ttft_ms", int((time.monotonic() - t0) * 1000))
+        parts.append(text)
+        if on_token:
+            on_token(text)
+  text = "".join(parts)
+  _llm_cache_put(key, text)
+  return text
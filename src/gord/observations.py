@@ -0,0 +1,216 @@
+import asyncio
+import inspect
+import json
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from gord.address import canonical_address
+from gord.settings import OBSERVATION_DIGEST_CHARS
+from gord import metrics
+
+
+# Rough chars-per-token ratio for English/JSON text with OpenAI tokenizers
+_CHARS_PER_TOKEN = 4
+
+
+def call_key(tool_name: str, args: Any) -> str:
+    """Stable key for a tool call, independent of argument order."""
+    try:
+        return f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
+    except TypeError:
+        return f"{tool_name}:{args}"
+
+
+class Observation(BaseModel):
+    """One tool result recorded during a run."""
+    index: int = Field(..., description="Position in the session, in recording order.")
+    task_id: Optional[int] = Field(None, description="Task that issued the call, if any.")
+    tool_name: str
+    args: Dict[str, Any] = Field(default_factory=dict)
+    text: str = Field(..., description="Full rendered output (or error) line as sent to prompts.")
+    is_error: bool = False
+    reused: bool = Field(False, description="Result was reused from an earlier identical call in this run.")
+
+    def digest(self, max_chars: int = OBSERVATION_DIGEST_CHARS) -> str:
+        """Compact one-line form used when the observation belongs to another task."""
+        body = " ".join(self.text.split())
+        if len(body) > max_chars:
+            body = f"{body[:max_chars]} …[+{len(body) - max_chars} chars, task {self.task_id}]"
+        return body
+
+
+class ObservationStore:
+    """Tool observations for a run, in recording order.
+
+    Prompts for a task get the observations of that task and of the tasks it
+    depends on in full, and compact digests of everything else; the final
+    answer still sees everything.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: List[Observation] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, task_id: Optional[int], tool_name: str, args: Dict[str, Any], result: Any, is_error: bool = False, reused: bool = False) -> Observation:
+        if is_error:
+            text = f"Error from {tool_name} with args {args}: {result}"
+        elif reused:
+            text = f"Output of {tool_name} with args {args} (reused from an earlier identical call): {result}"
+        else:
+            text = f"Output of {tool_name} with args {args}: {result}"
+        with self._lock:
+            obs = Observation(index=len(self._items), task_id=task_id, tool_name=tool_name, args=dict(args or {}), text=text, is_error=is_error, reused=reused)
+            self._items.append(obs)
+        return obs
+
+    def items(self) -> List[Observation]:
+        """Every observation, in recording order."""
+        with self._lock:
+            return list(self._items)
+
+    def restore(self, observations: List[Observation]) -> None:
+        """Re-index observations saved by an earlier run, keeping their order."""
+        with self._lock:
+            for o in observations:
+                self._items.append(o.model_copy(update={"index": len(self._items)}))
+
+    def texts(self) -> List[str]:
+        """Every observation in full, in recording order."""
+        with self._lock:
+            return [o.text for o in self._items]
+
+    def render(self, task_id: Optional[int] = None, depends_on: Iterable[int] = ()) -> str:
+        """Prompt context for `task_id`.
+
+        Its own observations and those of the tasks in `depends_on` are shown
+        in full (a task reasons over its prerequisites' findings); the rest
+        as digests.
+        """
+        full = {task_id, *depends_on}
+        with self._lock:
+            items = list(self._items)
+        lines = [o.text if o.task_id in full else o.digest() for o in items]
+        windowed = "\n".join(lines)
+        full_chars = sum(len(o.text) for o in items) + max(len(items) - 1, 0)
+        saved = (full_chars - len(windowed)) // _CHARS_PER_TOKEN
+        if saved > 0:
+            metrics.increment('observation_tokens_saved', saved)
+        return windowed
+
+
+def _normalize_value(v: Any) -> Any:
+    if isinstance(v, str):
+        # Same normalization as the search caches: punctuation is query syntax
+        # ("site:", quotes, "-term") and stays significant
+        return " ".join(v.casefold().split())
+    return v
+
+
+class ToolMemo:
+    """Per-run results of tool calls, keyed by tool name and normalized arguments.
+
+    Entries are futures, so a repeat issued while the first call is still in
+    flight (another task, or the same batch) waits for it instead of calling
+    the provider again. A call asking for `count` results is also served by
+    an earlier, finished call of the same query that asked for more, when
+    its output can be cut down to `count` (see `trim_results`).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Tuple[Optional[int], asyncio.Future]]] = {}
+
+    @staticmethod
+    def _split(tool, args: Dict[str, Any]) -> Tuple[str, Optional[int]]:
+        args = dict(args or {})
+        count = None
+        fields = getattr(getattr(tool, "args_schema", None), "model_fields", {}) or {}
+        if "count" in fields:
+            count = args.pop("count", None)
+            if count is None:
+                count = _default_count(tool, fields["count"].default)
+        key = call_key(tool.name, {
+            k: canonical_address(v) if k == "address" and isinstance(v, str) else _normalize_value(v)
+            for k, v in args.items() if v is not None
+        })
+        return key, count
+
+    def lookup(self, tool, args: Dict[str, Any]) -> Optional[Tuple[asyncio.Future, Optional[int]]]:
+        """Earlier call that covers this one, as (future, count to keep), or None."""
+        key, count = self._split(tool, args)
+        with self._lock:
+            for have, fut in self._entries.get(key, []):
+                if have == count:
+                    return fut, None
+                if count is not None and have is not None and have > count and _trimmable(fut):
+                    return fut, count
+        return None
+
+    def claim(self, tool, args: Dict[str, Any]) -> asyncio.Future:
+        """Register a call about to run; resolve it with `resolve`."""
+        key, count = self._split(tool, args)
+        fut = asyncio.get_running_loop().create_future()
+        with self._lock:
+            self._entries.setdefault(key, []).append((count, fut))
+        return fut
+
+    def resolve(self, tool, args: Dict[str, Any], fut: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Publish a claimed call's outcome. Failed calls are forgotten so a later call retries."""
+        if fut.done():
+            return
+        if error is None and not (isinstance(result, dict) and ("error" in result or "note" in result)):
+            fut.set_result(result)
+            return
+        key, _ = self._split(tool, args)
+        with self._lock:
+            self._entries[key] = [e for e in self._entries.get(key, []) if e[1] is not fut]
+        fut.set_exception(error if isinstance(error, Exception) else RuntimeError(f"Earlier identical call failed: {result if error is None else error}"))
+        # Mark retrieved so a failure nobody waited on is not logged at GC
+        fut.exception()
+
+
+def _default_count(tool, schema_default: Any) -> Any:
+    """`count` the tool runs with when the call omits it.
+
+    Omitted arguments fall through to the function's own default, which
+    can differ from the schema's (brave_search: 3 vs 10).
+    """
+    fn = getattr(tool, "coroutine", None) or getattr(tool, "func", None)
+    try:
+        param = inspect.signature(fn).parameters.get("count") if fn else None
+    except (TypeError, ValueError):
+        param = None
+    if param is not None and param.default is not inspect.Parameter.empty:
+        return param.default
+    return schema_default
+
+
+def _results_list(result: Any) -> Optional[List[Any]]:
+    """The result list of a search output: {"results": [...]} or Brave's {"web": {"results": [...]}}."""
+    if not isinstance(result, dict):
+        return None
+    if isinstance(result.get("results"), list):
+        return result["results"]
+    web = result.get("web")
+    if isinstance(web, dict) and isinstance(web.get("results"), list):
+        return web["results"]
+    return None
+
+
+def _trimmable(fut: asyncio.Future) -> bool:
+    # An unfinished call's output shape is unknown, so it only serves exact repeats
+    return fut.done() and not fut.cancelled() and fut.exception() is None and _results_list(fut.result()) is not None
+
+
+def trim_results(result: Any, count: Optional[int]) -> Any:
+    """Keep the first `count` results of a search output (see `_results_list`)."""
+    if count is None or _results_list(result) is None:
+        return result
+    if isinstance(result.get("results"), list):
+        return {**result, "results": result["results"][:count]}
+    return {**result, "web": {**result["web"], "results": result["web"]["results"][:count]}}
@@ -47,6 +47,21 @@ If you have not yet enhanced the address, call ping_aoa_search with the full add
 If you have the Ping AOA results already, do not call any tool.
 """
 
+# Fused act-and-validate rules, appended to the action prompt when one call
+# both validates the current task and picks the next tool calls.
+_FUSED_STEP_RULES = """
+Validation (same call):
+You also decide whether the CURRENT task is complete. Always respond with tool calls:
+- If the collected outputs already satisfy the task, call IsDone with {{"done": true}} and no other tool.
+- Otherwise call the next tool(s) needed to advance the task. You may add IsDone with {{"done": true}} next to them only if these calls are the last ones the task needs.
+The task is DONE only if the collected information is sufficient, specific, and sourced to satisfy the task's description.
+Partial, ambiguous, or unsourced findings are NOT done.
+"""
+
+FUSED_STEP_SYSTEM_PROMPT = ACTION_SYSTEM_PROMPT + _FUSED_STEP_RULES
+
+FUSED_STEP_SYSTEM_PROMPT_PING_ONLY = ACTION_SYSTEM_PROMPT_PING_ONLY + _FUSED_STEP_RULES
+
 # Routing prompt
 ROUTER_SYSTEM_PROMPT = """
 You are Gord's intent router. Classify the user's query into one of:
@@ -100,7 +115,7 @@ You are the validation component for Gord. Given the task description and the co
 Rules for completion:
 - The task is DONE only if the collected information is sufficient, specific, and sourced to satisfy the task's description.
 - Partial, ambiguous, or unsourced findings are NOT done.
-Output a single JSON object: {"done": true} or {"done": false}
+Output a single JSON object: {{"done": true}} or {{"done": false}}
 """
 
 
@@ -308,7 +323,8 @@ Occupancy taxonomy context (mapping hints)
 - If ambiguous after checking authoritative sources, choose the closest General category or Unknown rather than guessing.
 
 Output schema
-- Return JSON only: {{"tasks":[{{"id":1,"description":"...","done":false}}]}}
+- Return JSON only: {{"tasks":[{{"id":1,"description":"...","done":false,"depends_on":[]}}]}}
+- Parcel lookup, permits and occupant identification do not depend on each other; only list a dependency when a task truly needs another task's findings (e.g., owner background needs the owner name).
 """
 
 PLANNING_SYSTEM_PROMPT_BUSINESS_DEEP = """
@@ -322,3 +338,22 @@ Plan a thorough sequence leveraging multiple search engines and images where rel
 Only include tasks achievable with the available tools.
 Output JSON {{"tasks": [...]}}.
 """
+
+
+def _check_system_prompts() -> None:
+    """Fail at import if a system prompt has an unescaped brace.
+
+    Every prompt is used as a ChatPromptTemplate whose only variable is the
+    user `prompt`; a literal `{"done": true}` becomes a variable named
+    '"done"' and every call using that prompt raises KeyError.
+    """
+    from langchain_core.prompts import ChatPromptTemplate
+
+    for name, value in globals().items():
+        if name.endswith("SYSTEM_PROMPT") or "SYSTEM_PROMPT_" in name:
+            template = ChatPromptTemplate.from_messages([("system", value), ("user", "{prompt}")])
+            if template.input_variables != ["prompt"]:
+                raise ValueError(f"{name} has template variables {template.input_variables}; escape literal braces as {{{{ }}}}")
+
+
+_check_system_prompts()
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict
+
+from gord import cancel, metrics
+from gord.settings import (
+    OPENAI_RPS,
+    OPENAI_MAX_IN_FLIGHT,
+    OPENAI_TPM,
+    BRAVE_RPS,
+    BRAVE_MAX_IN_FLIGHT,
+    GOOGLE_PSE_RPS,
+    GOOGLE_PSE_MAX_IN_FLIGHT,
+    PING_RPS,
+    PING_MAX_IN_FLIGHT,
+)
+
+
+# How often a waiter re-checks for a free in-flight slot
+_SLOT_POLL_SECONDS = 0.02
+
+
+class RateLimiter:
+    """Token buckets plus an in-flight cap for one provider, shared by the process.
+
+    Requests refill at `rate` per second up to a burst of `burst`; tokens
+    (OpenAI) refill at `tokens_per_minute` / 60 per second. A caller reserves
+    its share under a lock and then sleeps off the debt outside it, so
+    waiters are served in arrival order without polling the buckets. The
+    same limiter works from threads (`acquire`) and asyncio tasks
+    (`aacquire`). Any limit of 0 is unlimited.
+
+    Calls that had to wait for a slot or the buckets are counted per session
+    as `ratelimit_<name>_waits`, and the time they waited as
+    `ratelimit_<name>_wait_us` (microseconds, so short waits still add up).
+    """
+
+    def __init__(self, name: str, rate: float = 0, burst: float = 0, max_in_flight: int = 0, tokens_per_minute: int = 0):
+        self.name = name
+        self.rate = max(0.0, rate)
+        self.burst = max(1.0, burst or self.rate)
+        self.max_in_flight = max(0, max_in_flight)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self._lock = threading.Lock()
+        now = time.monotonic()
+        self._requests = self.burst
+        self._tokens = float(self.tokens_per_minute)
+        self._updated = now
+        self._paused_until = now
+        self._in_flight = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rate:
+            self._requests = min(self.burst, self._requests + elapsed * self.rate)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def _reserve(self, tokens: int) -> float:
+        """Take one request (and `tokens`) from the buckets; seconds until that is covered."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            delay = max(0.0, self._paused_until - now)
+            if self.rate:
+                self._requests -= 1
+                if self._requests < 0:
+                    delay = max(delay, -self._requests / self.rate)
+            if self.tokens_per_minute and tokens:
+                # A request larger than the whole bucket would never fit
+                self._tokens -= min(tokens, self.tokens_per_minute)
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens * 60 / self.tokens_per_minute)
+            return delay
+
+    def _try_slot(self) -> bool:
+        if not self.max_in_flight:
+            return True
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                return False
+            self._in_flight += 1
+            return True
+
+    def _release_slot(self) -> None:
+        if self.max_in_flight:
+            with self._lock:
+                self._in_flight -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds`, e.g. after the provider answered 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _record(self, waited: float) -> None:
+        metrics.increment(f"ratelimit_{self.name}_waits", 1)
+        metrics.increment(f"ratelimit_{self.name}_wait_us", round(waited * 1_000_000))
+
+    @contextmanager
+    def acquire(self, tokens: int = 0):
+        """Block until a request may be sent; the in-flight slot is held for the block."""
+        t0 = time.monotonic()
+        blocked = False
+        while not self._try_slot():
+            blocked = True
+            cancel.sleep(_SLOT_POLL_SECONDS)
+        try:
+            delay = self._reserve(tokens)
+            if delay:
+                blocked = True
+                cancel.sleep(delay)
+            if blocked:
+                self._record(time.monotonic() - t0)
+            yield
+        finally:
+            self._release_slot()
+
+    @asynccontextmanager
+    async def aacquire(self, tokens: int = 0):
+        t0 = time.monotonic()
+        blocked = False
+        while not self._try_slot():
+            blocked = True
+            await asyncio.sleep(_SLOT_POLL_SECONDS)
+        try:
+            delay = self._reserve(tokens)
+            if delay:
+                blocked = True
+                await asyncio.sleep(delay)
+            if blocked:
+                self._record(time.monotonic() - t0)
+            yield
+        finally:
+            self._release_slot()
+
+
+LIMITERS: Dict[str, RateLimiter] = {
+    "openai": RateLimiter("openai", OPENAI_RPS, max_in_flight=OPENAI_MAX_IN_FLIGHT, tokens_per_minute=OPENAI_TPM),
+    "brave": RateLimiter("brave", BRAVE_RPS, max_in_flight=BRAVE_MAX_IN_FLIGHT),
+    "google_pse": RateLimiter("google_pse", GOOGLE_PSE_RPS, max_in_flight=GOOGLE_PSE_MAX_IN_FLIGHT),
+    "ping_aoa": RateLimiter("ping_aoa", PING_RPS, max_in_flight=PING_MAX_IN_FLIGHT),
+}
+
+
+def limiter(provider: str) -> RateLimiter:
+    """The process-wide limiter for a provider (an unlimited one for unknown names)."""
+    found = LIMITERS.get(provider)
+    if found is None:
+        found = LIMITERS.setdefault(provider, RateLimiter(provider))
+    return found
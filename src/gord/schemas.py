@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 
 class Task(BaseModel):
@@ -7,6 +7,7 @@ class Task(BaseModel):
     id: int = Field(..., description="Unique identifier for the task.")
     description: str = Field(..., description="The description of the task.")
     done: bool = Field(False, description="Whether the task is completed.")
+    depends_on: List[int] = Field(default_factory=list, description="IDs of tasks whose results this task needs before it can start. Empty if it can run independently.")
 
 class TaskList(BaseModel):
     """Represents a list of tasks."""
@@ -42,3 +43,18 @@ class SOVIntake(BaseModel):
     """Structured extraction from an SOV JSON output for routing decisions."""
     num_locations: int = Field(0, description="Estimated number of distinct locations/records in the SOV.")
     addresses: List[str] = Field(default_factory=list, description="A list of up to 10 address strings found.")
+
+
+class PingPropertySummary(BaseModel):
+    """Compact projection of a Ping AOA (PG + PH) response; this, not the raw payload, goes into prompts."""
+    geocode: Dict[str, Any] = Field(default_factory=dict, description="PG geocoding fields: matched address, coordinates, precision, county, etc.")
+    flood: Dict[str, Any] = Field(default_factory=dict, description="FEMA flood zone, subtype, DFIRM id, version id/date.")
+    slosh: Dict[str, Any] = Field(default_factory=dict, description="SLOSH category and value.")
+    coast: Dict[str, Any] = Field(default_factory=dict, description="Distance to coast (miles/feet) and closest point.")
+    nri: Dict[str, Any] = Field(default_factory=dict, description="National Risk Index composite and hazard-specific values, scores and ratings.")
+    fire_protection: Dict[str, Any] = Field(default_factory=dict, description="Protection class and distances to fire station/hydrant.")
+    elevation: Dict[str, Any] = Field(default_factory=dict, description="Elevation and resolution in meters.")
+    sinkhole: Dict[str, Any] = Field(default_factory=dict, description="Florida sinkhole distance, if applicable.")
+    crime: Dict[str, Any] = Field(default_factory=dict, description="Crime grades, total and by type.")
+    other: Dict[str, Any] = Field(default_factory=dict, description="Remaining scalar PH attributes.")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Error message per source that failed.")
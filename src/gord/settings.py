@@ -5,6 +5,17 @@ BRAVE_SEARCH_URL = 'https://api.search.brave.com/res/v1/web/search'
 BRAVE_API_KEY = os.getenv("BRAVE_API_KEY")
 
 
+# Ping Data API (AOA enhance). Without PING_AUTH_TOKEN the environment's
+# PING_DATA_<STG|PROD>_AUTH_TOKEN is used; if that is unset too, the SDK's own
+# lookup (~/.pingintel.ini) applies when the client is first built.
+PING_ENVIRONMENT = os.getenv('PING_ENVIRONMENT', 'staging').strip().lower() or 'staging'
+PING_AUTH_TOKEN = (
+    os.getenv('PING_AUTH_TOKEN', '').strip()
+    or os.getenv('PING_DATA_PROD_AUTH_TOKEN' if PING_ENVIRONMENT.startswith('prod') else 'PING_DATA_STG_AUTH_TOKEN', '').strip()
+    or None
+)
+
+
 # Google Programmable Search Engine (PSE)
 GOOGLE_PSE_API_KEY = os.getenv("GOOGLE_PSE_API_KEY")
 GOOGLE_PSE_CX = os.getenv("GOOGLE_PSE_CX")
@@ -24,3 +35,79 @@ DOC_WEBHOOK_URL = os.getenv('DOC_WEBHOOK_URL', '').strip() or None
 DOC_WEBHOOK_TIMEOUT = int(os.getenv('DOC_WEBHOOK_TIMEOUT', '10').strip() or '10')
 DOC_WEBHOOK_AUTH = os.getenv('DOC_WEBHOOK_AUTH', '').strip() or None  # optional Bearer token
 DOC_PREVIEW_BYTES = int(os.getenv('DOC_PREVIEW_BYTES', '50000').strip() or '50000')
+
+# Agent execution
+# Max tool calls from a single model turn that run at the same time (1 = sequential)
+TOOL_CONCURRENCY = max(1, int(os.getenv('TOOL_CONCURRENCY', '4').strip() or '4'))
+# Max planned tasks whose action/validate loops run at the same time (1 = one task at a time)
+TASK_CONCURRENCY = max(1, int(os.getenv('TASK_CONCURRENCY', '3').strip() or '3'))
+# Validate the current task and choose its next tool calls in one LLM call instead of two
+FUSED_STEPS = os.getenv('FUSED_STEPS', 'false').strip().lower() in ('1', 'true', 'yes', 'on')
+# Max characters of another task's tool output shown in prompts (current task's outputs are sent in full)
+OBSERVATION_DIGEST_CHARS = int(os.getenv('OBSERVATION_DIGEST_CHARS', '300').strip() or '300')
+# Stream the final answer to the terminal token by token instead of waiting for the full report
+STREAM_ANSWER = os.getenv('STREAM_ANSWER', 'true').strip().lower() in ('1', 'true', 'yes', 'on')
+
+# Portfolio batch runs
+BATCH_CONCURRENCY = max(1, int(os.getenv('BATCH_CONCURRENCY', '8').strip() or '8'))
+BATCH_RETRIES = max(0, int(os.getenv('BATCH_RETRIES', '1').strip() or '1'))
+
+# Run checkpoints (resume a crashed or cancelled run by ID)
+CHECKPOINTS = os.getenv('CHECKPOINTS', 'true').strip().lower() in ('1', 'true', 'yes', 'on')
+CHECKPOINT_DIR = os.getenv('CHECKPOINT_DIR', '.gord/runs').strip() or '.gord/runs'
+
+# Per-run budget (0 = no limit). Past BUDGET_SOFT_FRACTION of any limit the
+# agent skips validation; at the limit it stops searching and answers.
+BUDGET_MAX_SECONDS = float(os.getenv('BUDGET_MAX_SECONDS', '0').strip() or '0')
+BUDGET_MAX_PROMPT_TOKENS = int(os.getenv('BUDGET_MAX_PROMPT_TOKENS', '0').strip() or '0')
+BUDGET_MAX_COMPLETION_TOKENS = int(os.getenv('BUDGET_MAX_COMPLETION_TOKENS', '0').strip() or '0')
+BUDGET_MAX_LLM_CALLS = int(os.getenv('BUDGET_MAX_LLM_CALLS', '0').strip() or '0')
+# Per-provider call ceilings as "provider=n,..." (providers: ping_aoa, brave, google_web, google_image)
+BUDGET_MAX_CALLS = os.getenv('BUDGET_MAX_CALLS', 'google_image=2').strip()
+BUDGET_SOFT_FRACTION = float(os.getenv('BUDGET_SOFT_FRACTION', '0.8').strip() or '0.8')
+
+# Shared HTTP connection pools (search tools, Ping, SOV downloads)
+HTTP_POOL_SIZE = max(1, int(os.getenv('HTTP_POOL_SIZE', '20').strip() or '20'))
+# Retries for 429/5xx and connection errors, with jittered exponential backoff
+# (or the server's Retry-After, capped at HTTP_BACKOFF_MAX seconds)
+HTTP_RETRIES = max(0, int(os.getenv('HTTP_RETRIES', '3').strip() or '3'))
+HTTP_BACKOFF_BASE = float(os.getenv('HTTP_BACKOFF_BASE', '0.5').strip() or '0.5')
+HTTP_BACKOFF_MAX = float(os.getenv('HTTP_BACKOFF_MAX', '30').strip() or '30')
+
+# Process-wide per-provider rate limits, shared by every session and batch
+# worker (0 = unlimited). RPS is requests per second, MAX_IN_FLIGHT the
+# concurrent requests; OpenAI tokens per minute are estimated per request
+# the way the provider meters them (prompt + expected completion).
+OPENAI_RPS = float(os.getenv('OPENAI_RPS', '0').strip() or '0')
+OPENAI_MAX_IN_FLIGHT = int(os.getenv('OPENAI_MAX_IN_FLIGHT', '16').strip() or '16')
+OPENAI_TPM = int(os.getenv('OPENAI_TPM', '0').strip() or '0')
+OPENAI_COMPLETION_TOKENS_ESTIMATE = int(os.getenv('OPENAI_COMPLETION_TOKENS_ESTIMATE', '1000').strip() or '1000')
+BRAVE_RPS = float(os.getenv('BRAVE_RPS', '20').strip() or '20')
+BRAVE_MAX_IN_FLIGHT = int(os.getenv('BRAVE_MAX_IN_FLIGHT', '8').strip() or '8')
+GOOGLE_PSE_RPS = float(os.getenv('GOOGLE_PSE_RPS', '10').strip() or '10')
+GOOGLE_PSE_MAX_IN_FLIGHT = int(os.getenv('GOOGLE_PSE_MAX_IN_FLIGHT', '8').strip() or '8')
+PING_RPS = float(os.getenv('PING_RPS', '5').strip() or '5')
+PING_MAX_IN_FLIGHT = int(os.getenv('PING_MAX_IN_FLIGHT', '8').strip() or '8')
+
+# Local result caches (SQLite, shared by every process on this machine)
+CACHE_PATH = os.getenv('CACHE_PATH', '.gord/cache.sqlite3').strip() or '.gord/cache.sqlite3'
+# Ping AOA enhance results; TTL in seconds (0 disables the cache)
+PING_CACHE_TTL = int(os.getenv('PING_CACHE_TTL', str(7 * 24 * 3600)).strip() or '0')
+PING_CACHE_MAX_ENTRIES = max(1, int(os.getenv('PING_CACHE_MAX_ENTRIES', '20000').strip() or '20000'))
+# Skip cache reads (fresh results are still written back)
+PING_CACHE_BYPASS = os.getenv('PING_CACHE_BYPASS', 'false').strip().lower() in ('1', 'true', 'yes', 'on')
+# Brave / Google PSE results, keyed by engine, query, count, type and country (TTL 0 disables)
+BRAVE_CACHE_TTL = int(os.getenv('BRAVE_CACHE_TTL', str(24 * 3600)).strip() or '0')
+GOOGLE_CACHE_TTL = int(os.getenv('GOOGLE_CACHE_TTL', str(24 * 3600)).strip() or '0')
+SEARCH_CACHE_MAX_ENTRIES = max(1, int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '50000').strip() or '50000'))
+# LLM response cache: off, record (always call, store responses) or replay
+# (serve stored responses, call and record on a miss)
+LLM_CACHE_MODE = os.getenv('LLM_CACHE_MODE', 'off').strip().lower()
+if LLM_CACHE_MODE not in ('off', 'record', 'replay'):
+    LLM_CACHE_MODE = 'off'
+LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', str(30 * 24 * 3600)).strip() or '0')
+LLM_CACHE_MAX_ENTRIES = max(1, int(os.getenv('LLM_CACHE_MAX_ENTRIES', '20000').strip() or '20000'))
+
+# Bulk Ping enhancement (`gord-agent enhance`)
+ENHANCE_CONCURRENCY = max(1, int(os.getenv('ENHANCE_CONCURRENCY', '8').strip() or '8'))
+ENHANCE_RETRIES = max(0, int(os.getenv('ENHANCE_RETRIES', '2').strip() or '2'))
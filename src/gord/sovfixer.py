@@ -4,9 +4,11 @@ import json
 import pathlib
 from typing import Optional, Tuple, Dict, Any, List
 
-import requests
 import pingintel_api
 
+from gord import http
+from gord.cancel import CancelToken, current_token
+
 
 def _get_token(env: str) -> Optional[str]:
     if env == "staging":
@@ -35,7 +37,14 @@ def start_and_poll(
     interval: float = 2.5,
     timeout: int = 600,
     outdir: str = ".",
+    cancel_token: Optional[CancelToken] = None,
 ) -> Tuple[bool, Dict[str, Any], List[pathlib.Path]]:
+    """Upload an SOV, poll until SOV Fixer finishes and download the outputs.
+
+    Cancelling `cancel_token` (default: the current session's token) stops
+    the poll within the same second and raises OperationCancelled.
+    """
+    cancel_token = cancel_token or current_token() or CancelToken()
     token = _get_token(env)
     if not token:
         raise RuntimeError("Missing auth token. Set PING_SOVFIXER_AUTH_TOKEN[_STG/_PROD] or PING_DATA_*_AUTH_TOKEN.")
@@ -54,6 +63,7 @@ def start_and_poll(
     last_pct = None
     final_resp: Dict[str, Any] = {}
     while True:
+        cancel_token.raise_if_cancelled()
         if time.time() - t0 > timeout:
             raise TimeoutError("Timeout reached while polling status.")
         resp = client.fix_sov_async_check_progress(sovid or start_ret)
@@ -75,7 +85,8 @@ def start_and_poll(
         if term in {"C", "COMPLETE", "COMPLETED", "DONE", "READY", "F", "FAILED", "E", "ERROR"}:
             final_resp = d
             break
-        time.sleep(interval)
+        if cancel_token.wait(interval):
+            cancel_token.raise_if_cancelled()
 
     # If failed, return without download
     if (final_resp.get('result') or {}).get('status') in ("FAILED", "ERROR") or (
@@ -93,6 +104,7 @@ def start_and_poll(
         return True, final_resp, out_paths
     print(f"Downloading {len(outputs)} output(s) to {outdir_p.resolve()} ...")
     for idx, out in enumerate(outputs, 1):
+        cancel_token.raise_if_cancelled()
         name = out.get('filename') or out.get('name') or f"{sovid}_out_{idx}"
         fmt = out.get('format') or out.get('output_format') or out.get('extension')
         ext = None
@@ -110,7 +122,7 @@ def start_and_poll(
         except Exception as de:
             try:
                 headers = {"Authorization": f"Bearer {token}"}
-                r = requests.get(url, headers=headers, timeout=60)
+                r = http.get(url, headers=headers, timeout=60)
                 r.raise_for_status()
                 with open(dest, 'wb') as fh:
                     fh.write(r.content)
@@ -1,14 +1,25 @@
 from langchain.tools import tool
 from pydantic import BaseModel, Field
-from typing import Optional, List
-import requests
+from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
+import asyncio
+import contextvars
+import threading
 import pingintel_api
+from requests.adapters import HTTPAdapter
 
 
 from gord.utils.logger import Logger
 from gord import metrics
+from gord import http
+from gord.cancel import raise_if_cancelled
+from gord.budget import current_budget
+from gord.schemas import PingPropertySummary
+from gord.cache import SqliteCache
+from gord.address import canonical_address
+from gord.ratelimit import limiter
 
 from gord.settings import (
     NUMBER_SEARCH_RESULTS,
@@ -16,10 +27,47 @@ from gord.settings import (
     BRAVE_API_KEY,
     GOOGLE_PSE_API_KEY,
     GOOGLE_PSE_CX,
-    GOOGLE_SEARCH_ENDPOINT
+    GOOGLE_SEARCH_ENDPOINT,
+    PING_CACHE_TTL,
+    PING_CACHE_MAX_ENTRIES,
+    PING_CACHE_BYPASS,
+    BRAVE_CACHE_TTL,
+    GOOGLE_CACHE_TTL,
+    SEARCH_CACHE_MAX_ENTRIES,
+    PING_ENVIRONMENT,
+    PING_AUTH_TOKEN,
+    HTTP_POOL_SIZE,
 )
 
-pingclient = pingintel_api.PingDataAPIClient(environment="staging", auth_token=os.environ['PING_DATA_STG_AUTH_TOKEN'])
+_PING_CLIENT: Optional[pingintel_api.PingDataAPIClient] = None
+_PING_CLIENT_PID: Optional[int] = None
+_PING_CLIENT_LOCK = threading.Lock()
+
+
+def get_ping_client() -> pingintel_api.PingDataAPIClient:
+    """The process's Ping Data API client, built on first use.
+
+    Importing this module does not need Ping credentials; a missing token
+    only fails the first Ping call. A forked worker builds its own client
+    rather than sharing the parent's connections.
+    """
+    global _PING_CLIENT, _PING_CLIENT_PID
+    pid = os.getpid()
+    if _PING_CLIENT is None or _PING_CLIENT_PID != pid:
+        with _PING_CLIENT_LOCK:
+            if _PING_CLIENT is None or _PING_CLIENT_PID != pid:
+                client = pingintel_api.PingDataAPIClient(environment=PING_ENVIRONMENT, auth_token=PING_AUTH_TOKEN)
+                # Batch and bulk enhance call it from several threads; keep the
+                # SDK adapter's retry policy (429/5xx with backoff)
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=client.session.get_adapter("https://").max_retries,
+                )
+                client.session.mount("https://", adapter)
+                client.session.mount("http://", adapter)
+                _PING_CLIENT, _PING_CLIENT_PID = client, pid
+    return _PING_CLIENT
 
 _LOGGER = Logger()
 
@@ -46,6 +94,216 @@ class PingAoaInput(BaseModel):
         description="Address to enhance via Ping AOA"
     )
 
+
+# -------------------- Ping AOA prefetch --------------------
+# The router extracts the address long before the action loop asks for
+# ping_aoa_search, so the enhance call can start while planning runs.
+# Prefetches belong to one run: the run owns the dict of pending tasks and
+# binds it here so its tool calls (and only its tool calls) can claim them.
+_PING_PREFETCH: contextvars.ContextVar[Optional[Dict[str, asyncio.Task]]] = contextvars.ContextVar(
+    "gord_ping_prefetch", default=None
+)
+
+
+def _ping_prefetch_key(address: str) -> str:
+    # The model may re-punctuate, re-case or re-abbreviate the routed address
+    return canonical_address(address)
+
+
+_PING_SOURCES = ["PG", "PH"]
+
+# Enhance results persist across runs and processes; re-quotes and renewals
+# keep bringing back the same addresses.
+PING_CACHE = SqliteCache("ping_aoa", PING_CACHE_TTL, PING_CACHE_MAX_ENTRIES, bypass=PING_CACHE_BYPASS)
+
+# Search results shared across sessions and processes; Google PSE has a hard
+# daily quota, and the same queries recur across locations and reruns.
+BRAVE_CACHE = SqliteCache("brave", BRAVE_CACHE_TTL, SEARCH_CACHE_MAX_ENTRIES)
+GOOGLE_CACHE = SqliteCache("google_pse", GOOGLE_CACHE_TTL, SEARCH_CACHE_MAX_ENTRIES)
+
+
+def _ping_cache_key(address: str) -> str:
+    return f"{_ping_prefetch_key(address)}|{','.join(sorted(_PING_SOURCES))}"
+
+
+def ping_failed_sources(ret: dict) -> List[str]:
+    """Sources that reported is_success=False (all of them if there is no location data)."""
+    location_data = (ret or {}).get("location_data") or {}
+    if not location_data:
+        return list(_PING_SOURCES)
+    return [src for src, item in location_data.items() if isinstance(item, dict) and item.get("is_success") is False]
+
+
+def strip_ping_raw(ret: dict) -> dict:
+    """The response without the raw provider payloads."""
+    location_data = (ret or {}).get("location_data") or {}
+    return {
+        **(ret or {}),
+        "location_data": {
+            src: ({k: v for k, v in item.items() if "raw" not in str(k).lower()} if isinstance(item, dict) else item)
+            for src, item in location_data.items()
+        },
+    }
+
+
+def _ping_cache_store(address: str, ret: dict) -> None:
+    """Cache a response if every source succeeded, without the raw provider payloads."""
+    if ping_failed_sources(ret):
+        return
+    PING_CACHE.set(_ping_cache_key(address), strip_ping_raw(ret))
+
+
+def _ping_enhance(address: str) -> dict:
+    cached = PING_CACHE.get(_ping_cache_key(address))
+    if cached is not None:
+        return cached
+    metrics.increment('ping_aoa', 1)
+    with limiter("ping_aoa").acquire():
+        ret = get_ping_client().enhance(address=address, sources=_PING_SOURCES, include_raw_response=True)
+    _ping_cache_store(address, ret)
+    return ret
+
+
+async def _aping_enhance(address: str) -> dict:
+    """Async twin of _ping_enhance: same endpoint and auth as the Ping client, over httpx."""
+    # A cache lookup is a local SQLite read; it does not need a thread
+    cached = PING_CACHE.get(_ping_cache_key(address))
+    if cached is not None:
+        return cached
+    metrics.increment('ping_aoa', 1)
+    params = {"address": address, "sources": _PING_SOURCES, "include_raw_response": True}
+    client = get_ping_client()
+    r = await http.aget(
+        f"{client.api_url}/api/v1/enhance",
+        params=params,
+        headers=dict(client.session.headers),
+        timeout=60,
+        limiter=limiter("ping_aoa"),
+    )
+    r.raise_for_status()
+    ret = r.json()
+    _ping_cache_store(address, ret)
+    return ret
+
+
+# -------------------- Ping AOA projection --------------------
+# The enhance payload (with raw provider responses, point lists and
+# geometries) is far larger than what the prompts use. Tools return this
+# projection; the raw response only reaches the debug log.
+_PING_GROUPS = (
+    # Checked in order against the flattened field name's "_"-delimited
+    # tokens; first match wins. A keyword matches consecutive tokens, its last
+    # part as a token prefix ("elev" -> elevation_ft, "coast" -> coastline).
+    ("slosh", ("slosh",)),
+    ("sinkhole", ("sinkhole", "dtfs")),
+    ("crime", ("crime",)),
+    ("elevation", ("elev",)),
+    ("nri", ("nri", "national_risk", "risk_score", "risk_value", "risk_ratng", "risk_rating",
+             "avalanche", "coastal_flood", "cold_wave", "drought", "earthquake", "hail", "heat_wave",
+             "hurricane", "ice_storm", "landslide", "lightning", "riverine", "strong_wind", "tornado",
+             "tsunami", "volcan", "wildfire", "winter_weather")),
+    ("flood", ("fema", "flood", "dfirm", "fld")),
+    ("coast", ("coast", "dtc")),
+    ("fire_protection", ("fire", "hydrant", "aais", "ppc", "protection_class")),
+)
+_PING_GROUP_TOKENS = tuple((group, tuple(tuple(k.split("_")) for k in keys)) for group, keys in _PING_GROUPS)
+_PING_META_KEYS = {"is_success", "status_code", "fetch_time", "error_message"}
+_PING_MAX_STR = 200
+_PING_MAX_OTHER = 40
+
+
+def _ping_flatten(prefix: str, value, out: Dict[str, object]) -> None:
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if "raw" in str(k).lower():
+                continue
+            _ping_flatten(f"{prefix}__{k}" if prefix else str(k), v, out)
+    elif isinstance(value, list):
+        # Short scalar lists (e.g. connected coastlines) are kept; point/geometry lists are not
+        if len(value) <= 5 and all(isinstance(v, (str, int, float, bool)) for v in value):
+            out[prefix] = value
+    elif isinstance(value, str):
+        # WKT geometries and similar blobs are useless to the model
+        if len(value) <= _PING_MAX_STR:
+            out[prefix] = value
+    elif value is not None:
+        out[prefix] = round(value, 6) if isinstance(value, float) else value
+
+
+def _ping_group(name: str) -> Optional[str]:
+    tokens = [t for t in name.lower().split("_") if t]
+    for group, keywords in _PING_GROUP_TOKENS:
+        for kw in keywords:
+            n = len(kw)
+            for i in range(len(tokens) - n + 1):
+                if tokens[i:i + n - 1] == list(kw[:-1]) and tokens[i + n - 1].startswith(kw[-1]):
+                    return group
+    return None
+
+
+def project_ping_response(ret) -> dict:
+    """Reduce an enhance response to the PingPropertySummary fields prompts use."""
+    summary = PingPropertySummary()
+    location_data = (ret or {}).get("location_data") or {}
+    for source, item in location_data.items():
+        if not isinstance(item, dict):
+            continue
+        if item.get("is_success") is False:
+            summary.errors[str(source)] = str(item.get("error_message") or f"status {item.get('status_code')}")
+        fields: Dict[str, object] = {}
+        _ping_flatten("", {k: v for k, v in item.items() if k not in _PING_META_KEYS}, fields)
+        for name, value in fields.items():
+            group = _ping_group(name)
+            if group is None:
+                group = "geocode" if source == "PG" else "other"
+            bucket = getattr(summary, group)
+            if group == "other" and len(bucket) >= _PING_MAX_OTHER:
+                continue
+            bucket[name] = value
+    projected = summary.model_dump(exclude_defaults=True)
+    try:
+        saved = (len(json.dumps(ret, default=str)) - len(json.dumps(projected, default=str))) // 4
+        if saved > 0:
+            metrics.increment('ping_tokens_saved', saved)
+    except (TypeError, ValueError):
+        pass
+    return projected
+
+
+def prefetch_ping_aoa(address: str, pending: Dict[str, asyncio.Task]) -> contextvars.Token:
+    """Start enhancing `address` as a task of the running loop, kept in the run's `pending`.
+
+    Binds `pending` to the current context, so the run's next ping_aoa_search
+    call for the same address awaits this result instead of issuing a second
+    request. Returns the token for `discard_ping_prefetch`.
+    """
+    key = _ping_prefetch_key(address)
+    if key not in pending:
+        # The task copies the caller's context, so the call counts toward its session metrics
+        pending[key] = asyncio.create_task(_aping_enhance(address))
+    return _PING_PREFETCH.set(pending)
+
+
+def discard_ping_prefetch(pending: Dict[str, asyncio.Task], token: contextvars.Token) -> None:
+    """Drop the run's unclaimed prefetches and unbind them from the context."""
+    for task in pending.values():
+        if task.done():
+            if not task.cancelled():
+                # Retrieve a failure so it is not reported as never retrieved
+                task.exception()
+        else:
+            task.cancel()
+    pending.clear()
+    _PING_PREFETCH.reset(token)
+
+
+def _take_ping_prefetch(address: str) -> Optional[asyncio.Task]:
+    pending = _PING_PREFETCH.get()
+    if not pending:
+        return None
+    return pending.pop(_ping_prefetch_key(address), None)
+
+
 @tool(args_schema=PingAoaInput)
 def ping_aoa_search(address: str) -> dict:
     """
@@ -53,12 +311,37 @@ def ping_aoa_search(address: str) -> dict:
     
     If you provide an address to this tool, it will return enriched location data, specifically
     the information in the 'PG' and 'PH' sources. PG stands for Ping Geocoding, and PH stands for 
-    Ping Hazard, which returns assessment data, flood zones, distance to coast ,etc about that location
+    Ping Hazard, which returns assessment data, flood zones, distance to coast ,etc about that location.
+    Results are grouped as geocode, flood, slosh, coast, nri, fire_protection, elevation, sinkhole, crime and other.
     """
-    metrics.increment('ping_aoa', 1)
-    ret = pingclient.enhance(address=address, sources=["PG", "PH"], include_raw_response=True)
+    ret = None
+    pending = _take_ping_prefetch(address)
+    # A blocking call cannot await the run's loop; only a finished prefetch is usable
+    if pending is not None and pending.done() and not pending.cancelled():
+        if pending.exception() is None:
+            ret = pending.result()
+            metrics.increment('ping_aoa_prefetch_used', 1)
+        else:
+            _LOGGER._log(f"[ping_aoa_search] Prefetch failed, retrying: {pending.exception()}")
+    if ret is None:
+        ret = _ping_enhance(address)
     _LOGGER._log(f"[ping_aoa_search] Address: {address}\nResponse: {json.dumps(ret, indent=2)[:8000]}")  
-    return ret
+    return project_ping_response(ret)
+
+
+async def _aping_aoa_search(address: str) -> dict:
+    ret = None
+    pending = _take_ping_prefetch(address)
+    if pending is not None:
+        try:
+            ret = await pending
+            metrics.increment('ping_aoa_prefetch_used', 1)
+        except Exception as e:
+            _LOGGER._log(f"[ping_aoa_search] Prefetch failed, retrying: {e}")
+    if ret is None:
+        ret = await _aping_enhance(address)
+    _LOGGER._log(f"[ping_aoa_search] Address: {address}\nResponse: {json.dumps(ret, indent=2)[:8000]}")
+    return project_ping_response(ret)
 
 
 @tool(args_schema=BraveSearchInput)
@@ -74,7 +357,44 @@ def brave_search(
     or any other information available on the public web. Returns web page titles,
     snippets, URLs, and other metadata from the search results.
     """
-    print('querying brave search api', q)
+    _LOGGER._log(f"[brave_search] q='{q}'")
+    key = _search_cache_key(q, count, country)
+    cached = BRAVE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    headers, params = _brave_request(q, count, country)
+    response = http.get(BRAVE_SEARCH_URL, params=params, headers=headers, timeout=30, limiter=limiter("brave"))
+    response.raise_for_status()
+    metrics.increment('brave', 1)
+    data = response.json()
+    BRAVE_CACHE.set(key, data)
+    return data
+
+
+async def _abrave_search(
+    q: str,
+    count: Optional[int] = NUMBER_SEARCH_RESULTS,
+    country: Optional[str] = None
+) -> dict:
+    _LOGGER._log(f"[brave_search] q='{q}'")
+    key = _search_cache_key(q, count, country)
+    cached = BRAVE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    headers, params = _brave_request(q, count, country)
+    response = await http.aget(BRAVE_SEARCH_URL, params=params, headers=headers, timeout=30, limiter=limiter("brave"))
+    response.raise_for_status()
+    metrics.increment('brave', 1)
+    data = response.json()
+    BRAVE_CACHE.set(key, data)
+    return data
+
+
+def _search_cache_key(query: str, *parts) -> str:
+    return "|".join([" ".join(query.casefold().split())] + ["" if p is None else str(p) for p in parts])
+
+
+def _brave_request(q: str, count: Optional[int], country: Optional[str]):
     headers = {
         "Accept": "application/json",
         "Accept-Encoding": "gzip",
@@ -84,11 +404,7 @@ def brave_search(
     params = {"q": q, "count": count}
     if country:
         params["country"] = country
-    
-    response = requests.get(BRAVE_SEARCH_URL, params=params, headers=headers, timeout=30)
-    response.raise_for_status()
-    metrics.increment('brave', 1)
-    return response.json()
+    return headers, params
 
 
 
@@ -104,51 +420,128 @@ class GoogleImageSearchInput(BaseModel):
     count: Optional[int] = Field(default=10, description="Number of image results to return (<= 50 recommended).")
 
 
-def _google_pse_search(query: str, count: int = 10, search_type: str = "web") -> List[dict]:
-    if not GOOGLE_PSE_API_KEY or not GOOGLE_PSE_CX:
-        raise RuntimeError("Missing GOOGLE_PSE_API_KEY or GOOGLE_PSE_CX env vars.")
-    results: List[dict] = []
-    start = 1
-    while len(results) < count:
-        num = min(10, count - len(results))
-        params = {
-            "key": GOOGLE_PSE_API_KEY,
-            "cx": GOOGLE_PSE_CX,
-            "q": query,
-            "num": num,
-            "start": start,
+def _google_pse_params(query: str, num: int, start: int, search_type: str) -> dict:
+    params = {
+        "key": GOOGLE_PSE_API_KEY,
+        "cx": GOOGLE_PSE_CX,
+        "q": query,
+        "num": num,
+        "start": start,
+    }
+    if search_type == "image":
+        params["searchType"] = "image"
+    return params
+
+
+def _google_pse_page(data: dict, search_type: str) -> List[dict]:
+    """Count one PSE request and convert its items to result entries."""
+    # Count by request and by type
+    if search_type == "image":
+        metrics.increment('google_image', 1)
+    else:
+        metrics.increment('google_web', 1)
+    entries = []
+    for i in data.get("items", []):
+        entry = {
+            "title": i.get("title"),
+            "link": i.get("link"),
+            "snippet": i.get("snippet"),
         }
         if search_type == "image":
-            params["searchType"] = "image"
-        r = requests.get(GOOGLE_SEARCH_ENDPOINT, params=params, timeout=30)
-        r.raise_for_status()
-        # Count by request and by type
-        if search_type == "image":
-            metrics.increment('google_image', 1)
-        else:
-            metrics.increment('google_web', 1)
-        data = r.json()
-        items = data.get("items", [])
+            img = i.get("image", {}) or {}
+            entry["image_context_link"] = img.get("contextLink")
+            entry["thumbnail_link"] = img.get("thumbnailLink")
+        entries.append(entry)
+    return entries
+
+
+def _google_pse_next_start(data: dict) -> Optional[int]:
+    return (data.get("queries", {}).get("nextPage") or [{}])[0].get("startIndex")
+
+
+# PSE page offsets are known up front (1, 11, 21, ...), so pages are fetched
+# together rather than following nextPage one round trip at a time
+_GOOGLE_PAGE_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="pse-page")
+
+
+def _google_pse_offsets(count: int) -> List[tuple]:
+    """(start, num) for each page needed to collect `count` results."""
+    return [(start, min(10, count - start + 1)) for start in range(1, count + 1, 10)]
+
+
+def _google_pse_merge(pages: list, search_type: str, count: int) -> List[dict]:
+    """Join fetched pages in rank order, stopping where sequential paging would have.
+
+    `pages` holds each page's JSON, or the exception its request raised; an
+    error only fails the search if paging would have reached that page.
+    """
+    # Every page that came back was a billed request, used or not
+    parsed = [(data, None if isinstance(data, BaseException) else _google_pse_page(data, search_type)) for data in pages]
+    results: List[dict] = []
+    for data, items in parsed:
+        if isinstance(data, BaseException):
+            raise data
         if not items:
             break
-        for i in items:
-            entry = {
-                "title": i.get("title"),
-                "link": i.get("link"),
-                "snippet": i.get("snippet"),
-            }
-            if search_type == "image":
-                img = i.get("image", {}) or {}
-                entry["image_context_link"] = img.get("contextLink")
-                entry["thumbnail_link"] = img.get("thumbnailLink")
-            results.append(entry)
-        next_page = (data.get("queries", {}).get("nextPage") or [{}])[0].get("startIndex")
-        if not next_page:
+        results.extend(items)
+        if not _google_pse_next_start(data):
             break
-        start = next_page
     return results[:count]
 
 
+def _google_pse_fetch(query: str, num: int, start: int, search_type: str) -> dict:
+    params = _google_pse_params(query, num, start, search_type)
+    r = http.get(GOOGLE_SEARCH_ENDPOINT, params=params, timeout=30, limiter=limiter("google_pse"))
+    r.raise_for_status()
+    return r.json()
+
+
+def _google_pse_search(query: str, count: int = 10, search_type: str = "web") -> List[dict]:
+    if not GOOGLE_PSE_API_KEY or not GOOGLE_PSE_CX:
+        raise RuntimeError("Missing GOOGLE_PSE_API_KEY or GOOGLE_PSE_CX env vars.")
+    key = _search_cache_key(query, count, search_type)
+    cached = GOOGLE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    # Blocking requests cannot be interrupted; stop before sending instead
+    raise_if_cancelled()
+    offsets = _google_pse_offsets(count)
+    if len(offsets) == 1:
+        pages = [_google_pse_fetch(query, offsets[0][1], offsets[0][0], search_type)]
+    else:
+        futures = [
+            _GOOGLE_PAGE_POOL.submit(contextvars.copy_context().run, _google_pse_fetch, query, num, start, search_type)
+            for start, num in offsets
+        ]
+        pages = [f.exception() or f.result() for f in futures]
+    results = _google_pse_merge(pages, search_type, count)
+    GOOGLE_CACHE.set(key, results)
+    return results
+
+
+async def _agoogle_pse_fetch(query: str, num: int, start: int, search_type: str) -> dict:
+    params = _google_pse_params(query, num, start, search_type)
+    r = await http.aget(GOOGLE_SEARCH_ENDPOINT, params=params, timeout=30, limiter=limiter("google_pse"))
+    r.raise_for_status()
+    return r.json()
+
+
+async def _agoogle_pse_search(query: str, count: int = 10, search_type: str = "web") -> List[dict]:
+    if not GOOGLE_PSE_API_KEY or not GOOGLE_PSE_CX:
+        raise RuntimeError("Missing GOOGLE_PSE_API_KEY or GOOGLE_PSE_CX env vars.")
+    key = _search_cache_key(query, count, search_type)
+    cached = GOOGLE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    pages = await asyncio.gather(
+        *(_agoogle_pse_fetch(query, num, start, search_type) for start, num in _google_pse_offsets(count)),
+        return_exceptions=True,
+    )
+    results = _google_pse_merge(pages, search_type, count)
+    GOOGLE_CACHE.set(key, results)
+    return results
+
+
 @tool(args_schema=GoogleWebSearchInput)
 def google_web_search(q: str, count: int = 10) -> dict:
     """
@@ -171,8 +564,8 @@ def google_image_search(q: str, count: int = NUMBER_SEARCH_RESULTS) -> dict:
     Use for image results with context and thumbnails; supports pagination up to 'count'.
     """
     try:
-        # Run-wide cap: avoid more than 2 image requests total
-        if (metrics.snapshot().get('google_image', 0) or 0) >= 2:
+        # Run-wide cap from the run's budget (google_image=2 by default)
+        if not current_budget().allows_tool("google_image_search"):
             _LOGGER._log("[google_image_search] Skipping: image request cap reached for this run")
             return {"results": [], "note": "image request cap reached"}
         # Hard cap to keep image searches minimal per call
@@ -185,6 +578,39 @@ def google_image_search(q: str, count: int = NUMBER_SEARCH_RESULTS) -> dict:
         return {"error": str(e)}
 
 
+async def _agoogle_web_search(q: str, count: int = 10) -> dict:
+    try:
+        items = await _agoogle_pse_search(q, count=count, search_type="web")
+        _LOGGER._log(f"[google_web_search] q='{q}'\nResults: {json.dumps(items, indent=2)[:2000]}")
+        return {"results": items}
+    except Exception as e:
+        _LOGGER._log(f"[google_web_search] Error: {e}")
+        return {"error": str(e)}
+
+
+async def _agoogle_image_search(q: str, count: int = NUMBER_SEARCH_RESULTS) -> dict:
+    try:
+        # Run-wide cap from the run's budget (google_image=2 by default)
+        if not current_budget().allows_tool("google_image_search"):
+            _LOGGER._log("[google_image_search] Skipping: image request cap reached for this run")
+            return {"results": [], "note": "image request cap reached"}
+        # Hard cap to keep image searches minimal per call
+        capped = min(count, 2)
+        items = await _agoogle_pse_search(q, count=capped, search_type="image")
+        _LOGGER._log(f"[google_image_search] q='{q}'\nResults: {json.dumps(items, indent=2)[:2000]}")
+        return {"results": items}
+    except Exception as e:
+        _LOGGER._log(f"[google_image_search] Error: {e}")
+        return {"error": str(e)}
+
+
+# Async bodies used by tool.arun/ainvoke (AsyncAgent); tool.run keeps the sync ones.
+ping_aoa_search.coroutine = _aping_aoa_search
+brave_search.coroutine = _abrave_search
+google_web_search.coroutine = _agoogle_web_search
+google_image_search.coroutine = _agoogle_image_search
+
+
 TOOLS = [
     ping_aoa_search,
     google_web_search,
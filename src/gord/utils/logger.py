@@ -35,10 +35,25 @@ class Logger:
 
     def log_summary(self, summary: str):
         self.ui.print_answer(summary)
+
+    def log_answer_start(self):
+        self.ui.print_answer_stream_start()
+
+    def log_answer_token(self, token: str):
+        self.ui.print_answer_stream_token(token)
+
+    def log_answer_end(self):
+        self.ui.print_answer_stream_end()
     
     def progress(self, message: str, success_message: str = ""):
         """Return a progress context manager for showing loading states."""
         return self.ui.progress(message, success_message)
 
+    def log_budget(self, summary: dict):
+        self.ui.print_budget(summary)
+
+    def log_run_saved(self, run_id: str, status: str):
+        self.ui.print_info(f"Run {run_id} {status}. Resume with: resume {run_id}")
+
     def log_metrics(self, metrics: dict):
         self.ui.print_metrics(metrics)
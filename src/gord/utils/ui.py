@@ -1,12 +1,34 @@
 import sys
 import time
+import asyncio
+import inspect
 import threading
+import contextvars
 from contextlib import contextmanager
 from typing import Optional, Callable
 from functools import wraps
 from gord.settings import DEBUG
 
 
+# Set per context (e.g. per asyncio task in batch runs) to silence all
+# terminal output of the agent UI except errors.
+_QUIET: contextvars.ContextVar[bool] = contextvars.ContextVar("gord_ui_quiet", default=False)
+
+
+def set_quiet(quiet: bool = True) -> None:
+    """Silence (or restore) spinners and UI output for the current context."""
+    _QUIET.set(quiet)
+
+
+def _unless_quiet(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _QUIET.get():
+            return None
+        return func(*args, **kwargs)
+    return wrapper
+
+
 class Colors:
     BLUE = "\033[94m"
     CYAN = "\033[96m"
@@ -24,6 +46,11 @@ class Spinner:
     """An animated spinner that runs in a separate thread."""
     
     FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+
+    # Only one spinner animates at a time; spinners started while another is
+    # running (e.g. from concurrently running tasks) stay silent.
+    _active_lock = threading.Lock()
+    _active: Optional["Spinner"] = None
     
     def __init__(self, message: str = "", color: str = Colors.CYAN):
         self.message = message
@@ -43,6 +70,12 @@ class Spinner:
     
     def start(self):
         """Start the spinner animation."""
+        if _QUIET.get():
+            return
+        with Spinner._active_lock:
+            if Spinner._active is not None:
+                return
+            Spinner._active = self
         if not self.running:
             self.running = True
             self.thread = threading.Thread(target=self._animate, daemon=True)
@@ -59,6 +92,8 @@ class Spinner:
             if final_message:
                 print(f"{symbol_color}{symbol}{Colors.ENDC} {final_message}")
             sys.stdout.flush()
+            with Spinner._active_lock:
+                Spinner._active = None
     
     def update_message(self, message: str):
         """Update the spinner message."""
@@ -66,8 +101,25 @@ class Spinner:
 
 
 def show_progress(message: str, success_message: str = ""):
-    """Decorator to show progress spinner while a function executes."""
+    """Decorator to show progress spinner while a function (or coroutine function) executes."""
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                spinner = Spinner(message, color=Colors.CYAN)
+                spinner.start()
+                try:
+                    result = await func(*args, **kwargs)
+                    spinner.stop(success_message or message.replace("...", " ✓"), symbol="✓", symbol_color=Colors.GREEN)
+                    return result
+                except (KeyboardInterrupt, asyncio.CancelledError):
+                    spinner.stop("Cancelled", symbol="⎋", symbol_color=Colors.YELLOW)
+                    raise
+                except Exception as e:
+                    spinner.stop(f"Failed: {str(e)}", symbol="✗", symbol_color=Colors.RED)
+                    raise
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             spinner = Spinner(message, color=Colors.CYAN)
@@ -101,16 +153,21 @@ class UI:
         try:
             yield spinner
             spinner.stop(success_message or message.replace("...", " ✓"), symbol="✓", symbol_color=Colors.GREEN)
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            spinner.stop("Cancelled", symbol="⎋", symbol_color=Colors.YELLOW)
+            raise
         except Exception as e:
             spinner.stop(f"Failed: {str(e)}", symbol="✗", symbol_color=Colors.RED)
             raise
         finally:
             self.current_spinner = None
     
+    @_unless_quiet
     def print_header(self, text: str):
         """Print a section header."""
         print(f"\n{Colors.BOLD}{Colors.BLUE}╭─ {text}{Colors.ENDC}")
     
+    @_unless_quiet
     def print_task_list(self, tasks):
         """Print a clean list of planned tasks."""
         if not tasks:
@@ -123,19 +180,23 @@ class UI:
             print(f"{Colors.BLUE}│{Colors.ENDC} {color}{status}{Colors.ENDC} {desc}")
         print(f"{Colors.BLUE}╰{'─' * 50}{Colors.ENDC}\n")
     
+    @_unless_quiet
     def print_task_start(self, task_desc: str):
         """Print when starting a task."""
         print(f"\n{Colors.BOLD}{Colors.CYAN}▶ Task:{Colors.ENDC} {task_desc}")
     
+    @_unless_quiet
     def print_task_done(self, task_desc: str):
         """Print when a task is completed."""
         print(f"{Colors.GREEN}  ✓ Completed{Colors.ENDC} {Colors.DIM}│ {task_desc}{Colors.ENDC}")
     
+    @_unless_quiet
     def print_tool_run(self, tool_name: str, args: str = ""):
         """Print when a tool is executed."""
         args_display = f" {Colors.DIM}({args[:50]}...){Colors.ENDC}" if args and len(args) > 0 else ""
         print(f"  {Colors.YELLOW}⚡{Colors.ENDC} {tool_name}{args_display}")
     
+    @_unless_quiet
     def print_answer(self, answer: str):
         """Print the final answer in a beautiful box."""
         width = 80
@@ -175,6 +236,29 @@ class UI:
         # Bottom border
         print(f"{Colors.BOLD}{Colors.BLUE}╚{'═' * (width - 2)}╝{Colors.ENDC}\n")
 
+    @_unless_quiet
+    def print_answer_stream_start(self):
+        """Print the answer box header before streamed tokens."""
+        width = 80
+        title = "ANSWER"
+        padding = (width - len(title) - 2) // 2
+        print(f"\n{Colors.BOLD}{Colors.BLUE}╔{'═' * (width - 2)}╗{Colors.ENDC}")
+        print(f"{Colors.BOLD}{Colors.BLUE}║{' ' * padding}{title}{' ' * (width - len(title) - padding - 2)}║{Colors.ENDC}")
+        print(f"{Colors.BLUE}╚{'═' * (width - 2)}╝{Colors.ENDC}\n")
+
+    @_unless_quiet
+    def print_answer_stream_token(self, token: str):
+        """Write one streamed answer chunk as it arrives."""
+        sys.stdout.write(token)
+        sys.stdout.flush()
+
+    @_unless_quiet
+    def print_answer_stream_end(self):
+        """Close a streamed answer."""
+        width = 80
+        print(f"\n\n{Colors.BOLD}{Colors.BLUE}{'═' * width}{Colors.ENDC}\n")
+
+    @_unless_quiet
     def print_metrics(self, metrics: dict):
         """Print API usage metrics after the answer."""
         if not metrics:
@@ -182,8 +266,23 @@ class UI:
         print(f"{Colors.BOLD}{Colors.MAGENTA}API USAGE{Colors.ENDC}")
         for k, v in metrics.items():
             print(f"- {k}: {v}")
+            if k.endswith("_cache_hit"):
+                ns = k[: -len("_cache_hit")]
+                lookups = v + metrics.get(f"{ns}_cache_miss", 0)
+                print(f"- {ns}_cache_hit_rate: {v / lookups:.0%}")
         print("")
     
+    @_unless_quiet
+    def print_budget(self, summary: dict):
+        """Print used/limit for each budgeted resource after the answer."""
+        if not summary:
+            return
+        print(f"{Colors.BOLD}{Colors.MAGENTA}BUDGET{Colors.ENDC}")
+        for k, v in summary.items():
+            print(f"- {k}: {v}")
+        print("")
+
+    @_unless_quiet
     def print_info(self, message: str):
         """Print an info message."""
         print(f"{Colors.DIM}{message}{Colors.ENDC}")
@@ -193,6 +292,7 @@ class UI:
         # Always show errors
         print(f"{Colors.RED}✗ Error:{Colors.ENDC} {message}")
     
+    @_unless_quiet
     def print_warning(self, message: str):
         """Print a warning message."""
         print(f"{Colors.YELLOW}⚠ Warning:{Colors.ENDC} {message}")